@@ -11,11 +11,12 @@ Usage: python ingestion.py
 Configure the target project path in the main() function.
 """
 import os
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from itertools import islice
 import threading
 from src.utils.directory_scanner import get_directory_tree, generate_text_tree
-from src.llm.llm_client import generate_entrypoints_list, review_csharp_methods
+from src.llm.llm_client import generate_entrypoints_list, review_csharp_methods, _strip_code_fence
 from src.parsers.parser_manager import ParserManager
 from src.database.graph_db_factory import CallStackGraphDB
 from src.core.config import Config
@@ -106,21 +107,12 @@ def review_methods_with_llm_parallel(graph_db, batch_size=10, max_workers=3):
     graph_db.clear_existing_reviews()
     print("   • Cleared existing reviews")
     
-    # Get all methods that need review
-    all_methods = graph_db.get_all_methods_for_review()
-    total_methods = len(all_methods)
-    
-    if total_methods == 0:
-        print("   • No methods found for review")
-        return
-    
-    print(f"   • Found {total_methods} methods to review")
+    # Methods are paged from the database as batches are handed out, so only the
+    # batches in flight are held in memory
+    methods = graph_db.iter_methods_for_review()
+    batches = iter(lambda: list(islice(methods, batch_size)), [])
     print(f"   • Using batch size: {batch_size}, workers: {max_workers}")
     
-    # Split methods into batches
-    batches = [all_methods[i:i + batch_size] for i in range(0, total_methods, batch_size)]
-    print(f"   • Split into {len(batches)} batches")
-    
     total_reviews_created = 0
     total_batches_processed = 0
     
@@ -143,22 +135,7 @@ def review_methods_with_llm_parallel(graph_db, batch_size=10, max_workers=3):
                 
                 if review_json:
                     try:
-                        # Clean the JSON response (remove markdown code blocks if present)
-                        cleaned_review_json = review_json.strip()
-                        if cleaned_review_json.startswith('```json'):
-                            # Remove markdown code block wrapper
-                            cleaned_review_json = cleaned_review_json[7:]  # Remove '```json'
-                            if cleaned_review_json.endswith('```'):
-                                cleaned_review_json = cleaned_review_json[:-3]  # Remove trailing '```'
-                            cleaned_review_json = cleaned_review_json.strip()
-                        elif cleaned_review_json.startswith('```'):
-                            # Handle generic code blocks
-                            cleaned_review_json = cleaned_review_json[3:]  # Remove '```'
-                            if cleaned_review_json.endswith('```'):
-                                cleaned_review_json = cleaned_review_json[:-3]  # Remove trailing '```'
-                            cleaned_review_json = cleaned_review_json.strip()
-                        
-                        reviews = json.loads(cleaned_review_json)
+                        reviews = orjson.loads(_strip_code_fence(review_json))
                         
                         # Store each review in the database
                         for review in reviews:
@@ -166,7 +143,7 @@ def review_methods_with_llm_parallel(graph_db, batch_size=10, max_workers=3):
                                 graph_db.add_review(method["method_id"], review)
                                 batch_reviews += 1
                                 
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         print(f"   ⚠️  JSON decode error for method {method['class_name']}.{method['method_name']}: {e}")
                         
             except Exception as e:
@@ -174,27 +151,38 @@ def review_methods_with_llm_parallel(graph_db, batch_size=10, max_workers=3):
         
         return batch_reviews
     
-    # Process batches in parallel
+    total_methods = 0
+    
+    # Process batches in parallel, keeping at most two batches per worker queued
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_batch = {
-            executor.submit(process_batch, batch): i 
-            for i, batch in enumerate(batches)
-        }
+        pending = {}
+        batch_index = 0
         
-        for future in as_completed(future_to_batch):
-            batch_index = future_to_batch[future]
-            try:
-                batch_reviews = future.result()
-                total_reviews_created += batch_reviews
-                total_batches_processed += 1
-                
-                progress = (total_batches_processed / len(batches)) * 100
-                print(f"   • Batch {batch_index + 1}/{len(batches)} completed ({progress:.1f}%) - {batch_reviews} reviews created")
-                
-            except Exception as e:
-                print(f"   ⚠️  Batch {batch_index + 1} failed: {e}")
+        while True:
+            for batch in islice(batches, max_workers * 2 - len(pending)):
+                pending[executor.submit(process_batch, batch)] = (batch_index, len(batch))
+                batch_index += 1
+                total_methods += len(batch)
+            if not pending:
+                break
+            
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, batch_length = pending.pop(future)
+                try:
+                    batch_reviews = future.result()
+                    total_reviews_created += batch_reviews
+                    total_batches_processed += 1
+                    print(f"   • Batch {index + 1} completed ({batch_length} methods) - {batch_reviews} reviews created")
+                    
+                except Exception as e:
+                    print(f"   ⚠️  Batch {index + 1} failed: {e}")
     
-    print(f"✅ Method review completed: {total_reviews_created} reviews created for {total_methods} methods")
+    if total_methods == 0:
+        print("   • No methods found for review")
+        return
+    
+    print(f"✅ Method review completed: {total_reviews_created} reviews created for {total_methods} methods in {total_batches_processed} batches")
 
 
 def establish_method_call_relationships(graph_db, entry_point_results, remaining_results):
@@ -352,122 +340,105 @@ def main():
     
     # Generate AI entrypoints list
     print("\n🧠 Step 2: Analyzing codebase structure with LLM...")
-    entrypoints_json = generate_entrypoints_list(text_tree, project_path)
+    entrypoints_list = generate_entrypoints_list(text_tree, project_path)
     
-    if entrypoints_json:
-        try:
-            # Clean the JSON response (remove markdown code blocks if present)
-            cleaned_json = entrypoints_json.strip()
-            if cleaned_json.startswith('```json'):
-                # Remove markdown code block wrapper
-                cleaned_json = cleaned_json[7:]  # Remove '```json'
-                if cleaned_json.endswith('```'):
-                    cleaned_json = cleaned_json[:-3]  # Remove trailing '```'
-                cleaned_json = cleaned_json.strip()
-            elif cleaned_json.startswith('```'):
-                # Handle generic code blocks
-                cleaned_json = cleaned_json[3:]  # Remove '```'
-                if cleaned_json.endswith('```'):
-                    cleaned_json = cleaned_json[:-3]  # Remove trailing '```'
-                cleaned_json = cleaned_json.strip()
-            
-            # Parse the JSON response
-            entrypoints_list = json.loads(cleaned_json)
-            
-            # Display summary
-            print(f"✅ Identified {len(entrypoints_list)} entry points:")
-            for entry in entrypoints_list:
-                print(f"   • {entry['entrypoint']} ({entry['type']}) in {entry['file']}")
-            
-            # Initialize parser manager
-            print("\n🔍 Step 3: Parsing code files...")
-            parser_manager = ParserManager()
-            
-            # Extract file paths from entrypoints
-            file_paths = parser_manager.extract_files_from_entrypoints(entrypoints_list, project_path)
-            print(f"   • Extracted {len(file_paths)} unique files from entrypoints")
-            
-            # Group files by language
-            grouped_files = parser_manager.group_files_by_language(file_paths)
-            print(f"   • Grouped files by language: {list(grouped_files.keys())}")
-            
-            # Parse files using appropriate parsers
-            parsing_results = parser_manager.parse_files_by_language(grouped_files)
-            print("✅ Code parsing completed")
-            
-            # Create and populate graph database
-            print("\n📊 Step 4: Storing data in graph database...")
-            
-            # Initialize graph database using configuration
-            db_config = Config.get_database_config()
-            graph_db = CallStackGraphDB(db_type=Config.DATABASE_TYPE, **db_config)
-            print(f"   • Using {Config.DATABASE_TYPE.upper()} database")
-            
-            graph_db.store_parsing_results(parsing_results)
-            print("   • Data ingestion completed")
-            
-            # Additional step: Parse remaining files not identified as entry points
-            print("\n🔄 Step 5: Processing remaining files with parallelized parsing...")
-            
-            # # Get all C# files from the directory tree
-            # all_cs_files = []
-            # for item in tree_items:
-            #     # tree_items contains tuples: (item_type, name, level, full_path)
-            #     item_type, name, level, file_path = item
-            #     if item_type == 'file' and file_path.endswith('.cs') and os.path.isfile(file_path):
-            #         all_cs_files.append(file_path)
-            
-            # # Get entry point files for comparison
-            # entry_point_files = set(file_paths)  # These were already processed
-            
-            # Filter out entry point files to get remaining files
-            # remaining_files = [f for f in all_cs_files if f not in entry_point_files]
+    if entrypoints_list is not None:
+        # Display summary
+        print(f"✅ Identified {len(entrypoints_list)} entry points:")
+        for entry in entrypoints_list:
+            print(f"   • {entry['entrypoint']} ({entry['type']}) in {entry['file']}")
+        
+        # Initialize parser manager
+        print("\n🔍 Step 3: Parsing code files...")
+        parser_manager = ParserManager(cache_path=Config.PARSE_CACHE_PATH)
+        
+        # Extract file paths from entrypoints
+        file_paths = parser_manager.extract_files_from_entrypoints(entrypoints_list, project_path)
+        print(f"   • Extracted {len(file_paths)} unique files from entrypoints")
+        
+        # Group files by language
+        grouped_files = parser_manager.group_files_by_language(file_paths)
+        print(f"   • Grouped files by language: {list(grouped_files.keys())}")
+        
+        # Parse files using appropriate parsers
+        parsing_results = parser_manager.parse_files_by_language(grouped_files)
+        parser_manager.close()
+        print("✅ Code parsing completed")
+        
+        # Create and populate graph database
+        print("\n📊 Step 4: Storing data in graph database...")
+        
+        # Initialize graph database using configuration
+        db_config = Config.get_database_config()
+        graph_db = CallStackGraphDB(db_type=Config.DATABASE_TYPE, **db_config)
+        print(f"   • Using {Config.DATABASE_TYPE.upper()} database")
+        
+        graph_db.store_parsing_results(parsing_results, bulk=True)
+        print("   • Data ingestion completed")
+        
+        # Additional step: Parse remaining files not identified as entry points
+        print("\n🔄 Step 5: Processing remaining files with parallelized parsing...")
+        
+        # # Get all C# files from the directory tree
+        # all_cs_files = []
+        # for item in tree_items:
+        #     # tree_items contains tuples: (item_type, name, level, full_path)
+        #     item_type, name, level, file_path = item
+        #     if item_type == 'file' and file_path.endswith('.cs') and os.path.isfile(file_path):
+        #         all_cs_files.append(file_path)
+        
+        # # Get entry point files for comparison
+        # entry_point_files = set(file_paths)  # These were already processed
+        
+        # Filter out entry point files to get remaining files
+        # remaining_files = [f for f in all_cs_files if f not in entry_point_files]
+        
+        # print(f"   • Found {len(all_cs_files)} total C# files")
+        # print(f"   • Already processed {len(entry_point_files)} entry point files")
+        # print(f"   • Remaining {len(remaining_files)} files to process")
+        
+        # if remaining_files:
+        #     # Group remaining files by language (mostly C# in this case)
+        #     remaining_grouped = parser_manager.group_files_by_language(remaining_files)
+        #     print(f"   • Grouped remaining files by language: {list(remaining_grouped.keys())}")
             
-            # print(f"   • Found {len(all_cs_files)} total C# files")
-            # print(f"   • Already processed {len(entry_point_files)} entry point files")
-            # print(f"   • Remaining {len(remaining_files)} files to process")
+        #     # Parse remaining files with parallelization
+        #     print("   • Starting parallelized parsing of remaining files...")
+        #     remaining_parsing_results = parse_files_parallel(parser_manager, remaining_grouped)
+        #     print("✅ Parallelized parsing completed")
             
-            # if remaining_files:
-            #     # Group remaining files by language (mostly C# in this case)
-            #     remaining_grouped = parser_manager.group_files_by_language(remaining_files)
-            #     print(f"   • Grouped remaining files by language: {list(remaining_grouped.keys())}")
-                
-            #     # Parse remaining files with parallelization
-            #     print("   • Starting parallelized parsing of remaining files...")
-            #     remaining_parsing_results = parse_files_parallel(parser_manager, remaining_grouped)
-            #     print("✅ Parallelized parsing completed")
-                
-            #     # Store additional parsing results in the database
-            #     print("   • Storing additional parsing results...")
-            #     graph_db.store_parsing_results(remaining_parsing_results)
-            #     print("   • Additional data ingestion completed")
-            # else:
-            #     print("   • No additional files to process")
+        #     # Store additional parsing results in the database
+        #     print("   • Storing additional parsing results...")
+        #     graph_db.store_parsing_results(remaining_parsing_results)
+        #     print("   • Additional data ingestion completed")
+        # else:
+        #     print("   • No additional files to process")
 
-            # Additional step: Establish method call relationships
-            # print("\n🔗 Step 6: Establishing method call relationships...")
-            # establish_method_call_relationships(graph_db, parsing_results, remaining_parsing_results if remaining_files else {})
-            # print("✅ Method call relationships established")
+        # Additional step: Establish method call relationships
+        # print("\n🔗 Step 6: Establishing method call relationships...")
+        # establish_method_call_relationships(graph_db, parsing_results, remaining_parsing_results if remaining_files else {})
+        # print("✅ Method call relationships established")
 
-            # Review methods using LLM
-            review_methods_with_llm_parallel(graph_db, batch_size=5, max_workers=3)
+        # Review methods using LLM
+        review_methods_with_llm_parallel(graph_db, batch_size=5, max_workers=3)
+        
+        # Running web server workers poll this stamp and drop their cached responses
+        graph_db.mark_graph_changed()
+        print("   • Marked graph as changed for the web server caches")
 
-            print(f"\n📈 Generated Code Structure Visualization:")
-            print("="*60)
-            graph_db.print_graph()
-            graph_db.close()
-            
-            print("="*60)
-            print("✅ INGESTION PIPELINE COMPLETED SUCCESSFULLY")
-            print("="*60)
-            print(f"📊 Data stored in {Config.DATABASE_TYPE.upper()} database")
-            if Config.DATABASE_TYPE == "neo4j":
-                print("🌐 View in Neo4j Browser: http://localhost:7474")
-            print()
-            
-        except json.JSONDecodeError as e:
-            print(f"❌ Failed to parse JSON response: {e}")
-            print(f"Raw response: {entrypoints_json}")
+        print(f"\n📈 Generated Code Structure Visualization:")
+        print("="*60)
+        graph_db.print_graph()
+        graph_db.close()
+        
+        print("="*60)
+        print("✅ INGESTION PIPELINE COMPLETED SUCCESSFULLY")
+        print("="*60)
+        print(f"📊 Data stored in {Config.DATABASE_TYPE.upper()} database")
+        if Config.DATABASE_TYPE == "neo4j":
+            print("🌐 View in Neo4j Browser: http://localhost:7474")
+        print()
+        
     else:
         print("❌ Entrypoints list generation failed. Check your API credentials and network connection.")
 
@@ -7,6 +7,23 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.parsers.csharp_parser import CSharpParser
 
+def print_tree(node, content: bytes, depth: int = 0, max_depth: int = 3):
+    """Print the tree-sitter tree structure under node"""
+    if depth > max_depth:
+        return
+    
+    indent = "  " * depth
+    node_text = content[node.start_byte:node.end_byte].decode('utf-8', 'replace')
+    # Limit text length for readability
+    if len(node_text) > 50:
+        node_text = node_text[:47] + "..."
+    node_text = node_text.replace('\n', '\\n').replace('\r', '\\r')
+    
+    print(f"{indent}{node.type}: '{node_text}'")
+    
+    for child in node.children:
+        print_tree(child, content, depth + 1, max_depth)
+
 def debug_parse_file():
     parser = CSharpParser()
     
@@ -19,14 +36,14 @@ def debug_parse_file():
         print(result)
         
         # Also let's see the raw tree structure
-        with open(test_file, 'r', encoding='utf-8-sig') as f:  # Use utf-8-sig to handle BOM
-            content = f.read()
+        with open(test_file, 'rb') as f:
+            content = f.read().removeprefix(b'\xef\xbb\xbf')  # Drop a UTF-8 BOM
         
-        tree = parser.parser.parse(content.encode('utf-8'))
+        tree = parser.parser.parse(content)
         root_node = tree.root_node
         
         print("\nTree structure (first 20 nodes):")
-        parser._debug_print_tree(root_node, content, depth=0, max_depth=3)
+        print_tree(root_node, content, depth=0, max_depth=3)
         
     except Exception as e:
         print(f"Error: {e}")
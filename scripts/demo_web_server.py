@@ -18,8 +18,7 @@ def check_database_has_data():
         db_config = Config.get_database_config()
         graph_db = CallStackGraphDB(
             db_type=Config.DATABASE_TYPE, 
-            clear_db=False,
-            **db_config
+            **{**db_config, "clear_db": False}
         )
         
         with graph_db.db.driver.session() as session:
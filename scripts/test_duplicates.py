@@ -42,7 +42,7 @@ def test_duplicate_handling():
     try:
         # Create database instance (with clear_db=True initially)
         db_config = Config.get_database_config()
-        graph_db = CallStackGraphDB(db_type=Config.DATABASE_TYPE, clear_db=True, **db_config)
+        graph_db = CallStackGraphDB(db_type=Config.DATABASE_TYPE, **{**db_config, "clear_db": True})
         print("✅ Created database instance")
         
         # Store data first time
@@ -52,7 +52,7 @@ def test_duplicate_handling():
         
         # Close and recreate with clear_db=False to simulate ingestion.py behavior
         graph_db.close()
-        graph_db = CallStackGraphDB(db_type=Config.DATABASE_TYPE, clear_db=False, **db_config)
+        graph_db = CallStackGraphDB(db_type=Config.DATABASE_TYPE, **{**db_config, "clear_db": False})
         
         # Store same data again (this should handle duplicates gracefully)
         print("Storing same data again...")
@@ -1,59 +1,243 @@
 """
 Web API server for CodePecker - serves data from Neo4j database using FastAPI
 """
-import sys
 import os
-import webbrowser
+import asyncio
 import threading
 import time
-from typing import List, Dict, Any, Optional
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+import functools
+import hashlib
+import secrets
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from operator import itemgetter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Final
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from neo4j import AsyncGraphDatabase, AsyncDriver, READ_ACCESS
+from neo4j.exceptions import ClientError
+import orjson
 import uvicorn
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
-
 from src.database.graph_db_factory import CallStackGraphDB
 from src.core.config import Config
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect to the database on startup and always close the drivers on shutdown"""
+    # The sync driver calls below still block, so they run in worker threads;
+    # size the default pool for concurrent call-tree/statistics requests
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
+    
+    if not await asyncio.to_thread(initialize_database):
+        print("❌ Failed to initialize database. Please ensure:")
+        print("   1. Neo4j is running")
+        print("   2. Environment variables are set correctly")
+        print("   3. Database contains ingested data")
+    else:
+        app.state.graph_generation = await read_graph_generation()
+        app.state.generation_checked_at = time.monotonic()
+        await load_name_index()
+    
+    try:
+        yield
+    finally:
+        # Close drivers so pooled connections don't pile up across reloads
+        await close_database()
+
 # FastAPI app instance
 app = FastAPI(
     title="CodePecker API",
     description="Code Analysis API - serves data from Neo4j database",
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc
+    redoc_url="/redoc",  # ReDoc
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware with more permissive settings for local development
+# Name index of the ingested graph, filled by load_name_index (None = not loaded)
+app.state.classes = None
+app.state.methods = None
+app.state.names_loaded_at = 0.0
+# Generation stamp of the graph the caches were filled from, and when it was last checked
+app.state.graph_generation = None
+app.state.generation_checked_at = 0.0
+
+# CORS for UIs hosted on another origin (the bundled UI is same-origin and needs none).
+# Explicit lists let the middleware do plain membership checks per request
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["*"]
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,  # the API uses no cookies
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400  # let browsers cache preflight results for a day
 )
 
+# Compress larger responses (graph JSON is highly repetitive); small ones are
+# sent as-is, and Vary: Accept-Encoding is added by the middleware
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files directory for serving the UI
 static_dir = os.path.join(os.path.dirname(__file__), "static")
 if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
-# Global database instance
+# Global database instance (connected lazily, see get_db)
 graph_db = None
+# Async driver used by the request handlers so queries don't block the event loop
+async_driver = None
+_db_lock = asyncio.Lock()
+# Consecutive failed health checks before the drivers are replaced
+HEALTH_FAILURES_BEFORE_RESET = 3
+_health_failures = 0
+# Seconds replaced drivers stay open for requests still using them
+RETIRED_DRIVER_GRACE = 30
+_retired_drivers: List[tuple] = []
+_retire_tasks: set = set()
+_name_index_lock = asyncio.Lock()
+# Seconds before a name missing from the index triggers a reload, matching the
+# endpoint cache TTL
+NAME_INDEX_TTL = 60
+# Each worker polls the graph's generation stamp (renewed by ingestion and by
+# /api/cache/clear) at most this often, and drops its caches when it changed
+GENERATION_CHECK_INTERVAL = 5
+_generation_lock = asyncio.Lock()
+# Token required by /api/cache/clear; when unset only loopback clients may call it
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+# Queries slower than this are logged
+SLOW_QUERY_SECONDS = 1.0
+
+# Cypher queries, kept as constants and parameterized with $-params only so
+# Neo4j can reuse the cached plan for every request
+_Q_CLASSES: Final[str] = """
+MATCH (c:Class)
+RETURN c.name as name, 
+       c.file_path as file_path, 
+       c.visibility as visibility
+ORDER BY c.name
+"""
+
+# Full graph is fetched as two independent queries (run concurrently): one row
+# per class with its methods, and one flat row per call edge, so a method with
+# many calls never multiplies the class/method rows
+_Q_GRAPH_NODES: Final[str] = """
+MATCH (c:Class)
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+RETURN elementId(c) as id, 
+       c.name as name, 
+       c.file_path as file_path, 
+       c.visibility as visibility,
+       collect(CASE WHEN m IS NULL THEN null ELSE {id: elementId(m), name: m.name, visibility: m.visibility} END) as methods
+"""
+
+_Q_GRAPH_EDGES: Final[str] = """
+MATCH (m:Method)-[:METHOD_CALL]->(target:Method)
+WHERE target <> m
+RETURN DISTINCT elementId(m) as source, elementId(target) as target
+"""
+
+# Class with its methods and their resolved calls, in a single round-trip
+_Q_CLASS_GRAPH: Final[str] = """
+MATCH (c:Class {name: $class_name})
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+OPTIONAL MATCH (m)-[:METHOD_CALL]->(target_method:Method)<-[:HAS_METHOD]-(target_class:Class)
+WITH c, m, collect(DISTINCT target_class.name + '.' + target_method.name) as method_calls
+ORDER BY m.name
+RETURN c.name as name, 
+       c.file_path as file_path, 
+       c.visibility as visibility,
+       collect(CASE WHEN m IS NULL THEN null ELSE {
+           name: m.name,
+           visibility: m.visibility,
+           calls: method_calls
+       } END) as methods
+"""
+
+# Stamp written by ingestion whenever the graph changes (no row before the first one)
+_Q_GRAPH_GENERATION: Final[str] = """
+MATCH (g:GraphMeta {key: 'graph'})
+RETURN g.generation as generation
+"""
 
-# Pydantic models for request/response validation
+_Q_MARK_GRAPH_CHANGED: Final[str] = """
+MERGE (g:GraphMeta {key: 'graph'})
+SET g.generation = randomUUID()
+"""
+
+# Every class name with its method names, loaded once to 404 unknown names early
+_Q_NAME_INDEX: Final[str] = """
+MATCH (c:Class)
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+RETURN c.name as name, collect(m.name) as methods
+"""
+
+# Self-loop calls are left over from older imports and are not counted
+_Q_STATS: Final[str] = """
+MATCH (c:Class)
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+OPTIONAL MATCH (m)-[r:METHOD_CALL]->(callee:Method)
+WHERE callee <> m
+RETURN count(DISTINCT c) as total_classes,
+       count(DISTINCT m) as total_methods,
+       count(r) as total_method_calls
+"""
+
+# Class with its methods and their reviews in a single round-trip; nulls from
+# the OPTIONAL MATCHes are dropped by collect() so Python gets clean lists
+_Q_CLASS_REVIEWS: Final[str] = """
+MATCH (c:Class {name: $class_name})
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+OPTIONAL MATCH (m)-[:HAS_REVIEW]->(r:Review)
+WITH c, m, collect(
+    CASE WHEN r IS NOT NULL THEN {
+        method_name: r.method_name,
+        class_name: r.class_name,
+        severity: r.severity,
+        issue_type: r.issue_type,
+        description: r.description,
+        recommendation: r.recommendation,
+        line_reference: r.line_reference,
+        created_at: toString(r.created_at)
+    } ELSE null END
+) as reviews
+ORDER BY m.name
+RETURN c.name as name, 
+       c.file_path as file_path, 
+       c.visibility as visibility,
+       collect(CASE WHEN m IS NOT NULL THEN {
+           name: m.name,
+           visibility: m.visibility,
+           definition: m.definition,
+           reviews: reviews
+       } ELSE null END) as methods
+"""
+
+# Pydantic models for request/response validation. The per-row item types are
+# slotted stdlib dataclasses: pydantic still validates/serializes them as
+# fields, but building one from trusted DB rows is a plain __init__ and each
+# instance carries no __dict__
 class HealthResponse(BaseModel):
     status: str
     database_connected: bool
     database_type: str
 
-class ClassInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ClassInfo:
     name: str
     file_path: Optional[str]
     visibility: str
@@ -62,7 +246,8 @@ class ClassesResponse(BaseModel):
     classes: List[ClassInfo]
     count: int
 
-class MethodInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MethodInfo:
     name: str
     visibility: str
     calls: List[str]
@@ -73,6 +258,23 @@ class ClassGraphResponse(BaseModel):
     visibility: str
     methods: List[MethodInfo]
 
+class GraphNode(BaseModel):
+    id: str
+    label: str
+    type: str
+    visibility: Optional[str]
+    file_path: Optional[str] = None
+
+class GraphEdge(BaseModel):
+    source: str
+    target: str
+    type: str
+
+class FullGraphResponse(BaseModel):
+    nodes: List[GraphNode]
+    edges: List[GraphEdge]
+    stats: Dict[str, int]
+
 class StatsResponse(BaseModel):
     total_classes: int
     total_methods: int
@@ -89,11 +291,26 @@ class CallTreeResponse(BaseModel):
     root: Dict[str, str]
     tree: Dict[str, List[CallTreeNode]]
     max_depth: int
+    next_cursor: Optional[str] = None
+
+class MethodStatistics(BaseModel):
+    class_name: str
+    method: str
+    visibility: str
+    calls_made: int
+    called_by: int
+
+class CallStatisticsResponse(BaseModel):
+    class_filter: Optional[str]
+    methods: List[MethodStatistics]
+    summary: Optional[Dict[str, int]]
+    next_cursor: Optional[str]
 
 class ErrorResponse(BaseModel):
     error: str
 
-class ReviewInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ReviewInfo:
     method_name: str
     class_name: str
     severity: Optional[str]
@@ -117,14 +334,27 @@ class ClassReviewsResponse(BaseModel):
     total_methods: int
     total_reviews: int
 
+# List serializers are compiled once; returning their JSON directly skips the
+# response_model re-validation FastAPI performs on returned models
+_CLASS_LIST_ADAPTER = TypeAdapter(List[ClassInfo])
+_METHOD_LIST_ADAPTER = TypeAdapter(List[MethodInfo])
+_TREE_LEVEL_ADAPTER = TypeAdapter(List[CallTreeNode])
+
+# Field getters for the DB result dicts converted in per-node loops
+_TREE_NODE_FIELDS = itemgetter("class", "method", "visibility", "file_path", "calls")
+_METHOD_STATISTICS_FIELDS = itemgetter("class", "method", "visibility", "calls_made", "called_by")
+
+def _fast(cls, **fields):
+    """Build a model from trusted database values without running validation"""
+    return cls.model_construct(**fields)
+
 def initialize_database():
     """Initialize the database connection"""
-    global graph_db
+    global graph_db, async_driver
     try:
-        db_config = Config.get_database_config()
-        
         # For the web server, we never want to clear the database
-        # Override the clear_db setting if it exists
+        # Override the clear_db setting (in a copy, the shared config is read-only)
+        db_config = dict(Config.get_database_config())
         if 'clear_db' in db_config:
             db_config['clear_db'] = False
         
@@ -132,266 +362,639 @@ def initialize_database():
             db_type=Config.DATABASE_TYPE, 
             **db_config
         )
+        async_driver = AsyncGraphDatabase.driver(
+            db_config["uri"],
+            auth=(db_config["username"], db_config["password"]),
+            max_connection_pool_size=db_config["max_connection_pool_size"],
+            connection_acquisition_timeout=db_config["connection_acquisition_timeout"],
+            max_connection_lifetime=db_config["max_connection_lifetime"],
+            keep_alive=True
+        )
         print("✅ Database connection established")
         return True
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         return False
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup"""
-    if not initialize_database():
-        print("❌ Failed to initialize database. Please ensure:")
-        print("   1. Neo4j is running")
-        print("   2. Environment variables are set correctly")
-        print("   3. Database contains ingested data")
+async def get_db() -> CallStackGraphDB:
+    """Return the shared database wrapper, reconnecting if the last attempt failed"""
+    if graph_db is None:
+        async with _db_lock:
+            # Re-check under the lock so concurrent requests connect only once
+            if graph_db is None:
+                await asyncio.to_thread(initialize_database)
+    
+    if graph_db is None:
+        raise HTTPException(status_code=500, detail="Database not connected")
+    return graph_db
+
+async def _close_drivers(db, driver):
+    """Close a database wrapper and async driver pair, logging rather than raising"""
+    try:
+        if driver is not None:
+            await driver.close()
+        if db is not None:
+            await asyncio.to_thread(db.close)
+    except Exception as e:
+        print(f"⚠️  Error closing database connection: {e}")
+
+async def _close_retired_later(db, driver):
+    """Close retired drivers once the requests that were using them have finished"""
+    await asyncio.sleep(RETIRED_DRIVER_GRACE)
+    _retired_drivers.remove((db, driver))
+    await _close_drivers(db, driver)
+
+async def retire_database():
+    """Detach the drivers so the next get_db() reconnects
+    
+    Requests already holding the old drivers keep using them; they are closed only
+    after RETIRED_DRIVER_GRACE seconds.
+    """
+    global graph_db, async_driver
+    async with _db_lock:
+        retired = (graph_db, async_driver)
+        graph_db = None
+        async_driver = None
+    if retired != (None, None):
+        _retired_drivers.append(retired)
+        # Hold a reference so the pending close isn't garbage collected
+        task = asyncio.create_task(_close_retired_later(*retired))
+        _retire_tasks.add(task)
+        task.add_done_callback(_retire_tasks.discard)
+
+async def close_database():
+    """Close the current and any retired drivers (on shutdown)"""
+    global graph_db, async_driver
+    for task in list(_retire_tasks):
+        task.cancel()
+    async with _db_lock:
+        pairs = [(graph_db, async_driver)] + _retired_drivers
+        _retired_drivers.clear()
+        graph_db = None
+        async_driver = None
+    for db, driver in pairs:
+        await _close_drivers(db, driver)
+
+async def get_driver() -> AsyncDriver:
+    """Return the shared async Neo4j driver, connecting first if needed"""
+    await get_db()
+    return async_driver
+
+async def _collect_records(tx, query: str, params: Dict[str, Any]) -> List[Any]:
+    """Transaction function: run a query and materialize its records"""
+    result = await tx.run(query, params)
+    return [record async for record in result]
+
+async def _fetch_all(driver: AsyncDriver, query: str, **params) -> List[Any]:
+    """Run a read query in a managed transaction and return all of its records"""
+    # Read access lets a cluster route to read replicas; execute_read retries
+    # transient failures automatically
+    async with driver.session(database=Config.NEO4J_DATABASE, default_access_mode=READ_ACCESS) as session:
+        return await session.execute_read(_collect_records, query, params)
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed time-to-live"""
+    
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    async def get(self, key):
+        async with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return False, None
+    
+    async def set(self, key, value):
+        async with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+    
+    def clear(self):
+        self.entries.clear()
+
+# Every cache created by @cached, keyed by handler name
+_caches: Dict[str, _TTLCache] = {}
+
+def cached(ttl: float = 60, maxsize: int = 512):
+    """Cache an async handler's result per argument tuple (the graph does not change while serving)"""
+    def decorator(func):
+        cache = _caches[func.__name__] = _TTLCache(ttl, maxsize)
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            await sync_graph_generation()
+            key = (args, tuple(sorted(kwargs.items())))
+            found, value = await cache.get(key)
+            if found:
+                return value
+            value = await func(*args, **kwargs)
+            await cache.set(key, value)
+            return value
+        
+        return wrapper
+    return decorator
+
+def clear_caches():
+    """Drop all cached endpoint results, e.g. after the graph was re-ingested"""
+    for cache in _caches.values():
+        cache.clear()
+
+async def read_graph_generation() -> Optional[str]:
+    """The graph's current generation stamp (None if it has none or can't be read)"""
+    driver = async_driver
+    if driver is None:
+        return None
+    try:
+        records = await _fetch_all(driver, _Q_GRAPH_GENERATION)
+    except Exception as e:
+        print(f"⚠️  Could not read graph generation: {e}")
+        return None
+    return records[0]["generation"] if records else None
+
+async def sync_graph_generation():
+    """Drop this worker's caches and reload its name index if the graph changed
+    
+    Checks at most every GENERATION_CHECK_INTERVAL seconds, so every worker sees a
+    re-ingestion within that interval rather than the cache TTL.
+    """
+    if time.monotonic() - app.state.generation_checked_at < GENERATION_CHECK_INTERVAL:
+        return
+    async with _generation_lock:
+        # Re-check under the lock so concurrent requests query only once
+        if time.monotonic() - app.state.generation_checked_at < GENERATION_CHECK_INTERVAL:
+            return
+        app.state.generation_checked_at = time.monotonic()
+        if async_driver is None:
+            return
+        
+        generation = await read_graph_generation()
+        if generation is not None and generation != app.state.graph_generation:
+            app.state.graph_generation = generation
+            clear_caches()
+            await load_name_index()
+            print(f"🔄 Graph changed, cleared endpoint caches (generation {generation})")
+
+async def load_name_index():
+    """Load class and method names so handlers can reject unknown names without a query"""
+    driver = async_driver
+    if driver is None:
+        # Disconnected (e.g. drivers being replaced); keep the current index
+        print("⚠️  Not connected, name index not reloaded")
+        return
+    try:
+        records = await _fetch_all(driver, _Q_NAME_INDEX)
+        methods: Dict[str, set] = {}
+        for record in records:
+            methods.setdefault(record["name"], set()).update(record["methods"])
+        app.state.methods = {name: frozenset(names) for name, names in methods.items()}
+        app.state.classes = frozenset(app.state.methods)
+        print(f"📇 Loaded name index: {len(app.state.classes)} classes")
+    except Exception as e:
+        # Without the index handlers simply fall through to the database
+        app.state.classes = None
+        app.state.methods = None
+        print(f"⚠️  Could not load name index: {e}")
+    app.state.names_loaded_at = time.monotonic()
+
+def _is_known(class_name: str, method_name: Optional[str]) -> bool:
+    """Whether the name index holds the names (always True if it isn't loaded)"""
+    if app.state.classes is None:
+        return True
+    if class_name not in app.state.classes:
+        return False
+    return method_name is None or method_name in app.state.methods[class_name]
+
+async def require_known(class_name: str, method_name: Optional[str] = None):
+    """Raise 404 for names missing from the name index (no-op if it isn't loaded)
+    
+    A miss against an index older than NAME_INDEX_TTL reloads the index first, so
+    names ingested after the index was loaded are found within the same TTL as
+    the endpoint caches.
+    """
+    if _is_known(class_name, method_name):
+        return
+    if time.monotonic() - app.state.names_loaded_at > NAME_INDEX_TTL:
+        async with _name_index_lock:
+            # Re-check under the lock so concurrent misses reload only once
+            if time.monotonic() - app.state.names_loaded_at > NAME_INDEX_TTL:
+                await load_name_index()
+        if _is_known(class_name, method_name):
+            return
+    
+    if app.state.classes is None or class_name not in app.state.classes:
+        raise HTTPException(status_code=404, detail="Class not found")
+    raise HTTPException(status_code=404, detail="Method not found")
+
+# Read responses may be reused by browsers and proxies (compressed or not) for
+# a short while; the graph only changes when ingestion re-runs
+_CACHE_HEADERS = {"Cache-Control": "max-age=30"}
+
+def _etag(content: bytes) -> str:
+    """Strong ETag for a response body"""
+    return '"%s"' % hashlib.sha256(content).hexdigest()[:32]
+
+def _etag_response(request: Request, etag: str, content: bytes) -> Response:
+    """Return the body with its ETag, or an empty 304 if the client already has it"""
+    headers = {"ETag": etag, **_CACHE_HEADERS}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint - pings the database and reconnects if needed"""
+    global _health_failures
+    try:
+        driver = await get_driver()
+        await driver.verify_connectivity()
+        connected = True
+    except Exception:
+        connected = False
+    
+    # A single failure may be a blip; after several in a row, replace the drivers
+    # so the next request reconnects
+    _health_failures = 0 if connected else _health_failures + 1
+    if _health_failures >= HEALTH_FAILURES_BEFORE_RESET:
+        _health_failures = 0
+        await retire_database()
+    
     return HealthResponse(
         status="healthy",
-        database_connected=graph_db is not None,
+        database_connected=connected,
         database_type=Config.DATABASE_TYPE
     )
 
-@app.get("/api/classes", response_model=ClassesResponse)
-async def get_classes():
-    """Get all classes (entry points) from the database"""
-    if not graph_db:
-        raise HTTPException(status_code=500, detail="Database not connected")
+@cached(ttl=60, maxsize=512)
+async def _classes_payload():
+    """Build the /api/classes JSON body and its ETag"""
+    driver = await get_driver()
     
     try:
-        with graph_db.db.driver.session() as session:
-            query = """
-            MATCH (c:Class)
-            RETURN c.name as name, 
-                   c.file_path as file_path, 
-                   c.visibility as visibility
-            ORDER BY c.name
-            """
-            result = session.run(query)
-            
-            classes = []
-            for record in result:
-                classes.append(ClassInfo(
-                    name=record["name"],
-                    file_path=record["file_path"],
-                    visibility=record["visibility"]
-                ))
-            
-            return ClassesResponse(
-                classes=classes,
-                count=len(classes)
-            )
+        records = await _fetch_all(driver, _Q_CLASSES)
+        
+        classes = []
+        for record in records:
+            classes.append(ClassInfo(
+                name=record["name"],
+                file_path=record["file_path"],
+                visibility=record["visibility"]
+            ))
+        
+        content = b'{"classes":%s,"count":%d}' % (_CLASS_LIST_ADAPTER.dump_json(classes), len(classes))
+        return _etag(content), content
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/classes", response_model=ClassesResponse)
+async def get_classes(request: Request):
+    """Get all classes (entry points) from the database"""
+    etag, content = await _classes_payload()
+    return _etag_response(request, etag, content)
+
+@app.get("/api/classes/stream")
+async def stream_classes():
+    """Stream all classes as NDJSON, one line per record as Neo4j produces it"""
+    driver = await get_driver()
+    
+    async def generate():
+        # The session stays open until the last record has been sent
+        async with driver.session(database=Config.NEO4J_DATABASE, default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_Q_CLASSES)
+            async for record in result:
+                yield orjson.dumps(record.data()) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.get("/api/class/{class_name}/graph", response_model=ClassGraphResponse)
 async def get_class_graph(class_name: str):
     """Get the complete graph for a specific class"""
-    if not graph_db:
-        raise HTTPException(status_code=500, detail="Database not connected")
+    await require_known(class_name)
+    driver = await get_driver()
     
     try:
-        with graph_db.db.driver.session() as session:
-            # Get class info
-            class_query = """
-            MATCH (c:Class {name: $class_name})
-            RETURN c.name as name, 
-                   c.file_path as file_path, 
-                   c.visibility as visibility
-            """
-            class_result = session.run(class_query, class_name=class_name)
-            class_record = class_result.single()
-            
-            if not class_record:
-                raise HTTPException(status_code=404, detail="Class not found")
-            
-            # Get methods and their calls
-            methods_query = """
-            MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
-            OPTIONAL MATCH (m)-[:METHOD_CALL]->(target_method:Method)<-[:HAS_METHOD]-(target_class:Class)
-            RETURN m.name as method_name, 
-                   m.visibility as method_visibility,
-                   collect(DISTINCT target_class.name + '.' + target_method.name) as method_calls
-            ORDER BY m.name
-            """
-            methods_result = session.run(methods_query, class_name=class_name)
-            
-            methods = []
-            for method_record in methods_result:
-                # Filter out None values from method_calls
-                method_calls = [call for call in method_record["method_calls"] if call is not None]
-                
-                methods.append(MethodInfo(
-                    name=method_record["method_name"],
-                    visibility=method_record["method_visibility"],
-                    calls=method_calls
-                ))
-            
-            return ClassGraphResponse(
-                name=class_record["name"],
-                file_path=class_record["file_path"],
-                visibility=class_record["visibility"],
-                methods=methods
-            )
+        records = await _fetch_all(driver, _Q_CLASS_GRAPH, class_name=class_name)
+        
+        if not records:
+            raise HTTPException(status_code=404, detail="Class not found")
+        class_record = records[0]
+        
+        methods = []
+        for method in class_record["methods"]:
+            # calls is already null-free: collect() skips unmatched OPTIONAL MATCH rows
+            methods.append(MethodInfo(
+                name=method["name"],
+                visibility=method["visibility"],
+                calls=method["calls"]
+            ))
+        
+        content = b'{"name":%s,"file_path":%s,"visibility":%s,"methods":%s}' % (
+            orjson.dumps(class_record["name"]),
+            orjson.dumps(class_record["file_path"]),
+            orjson.dumps(class_record["visibility"]),
+            _METHOD_LIST_ADAPTER.dump_json(methods)
+        )
+        return Response(content=content, media_type="application/json", headers=_CACHE_HEADERS)
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/stats", response_model=StatsResponse)
-async def get_stats():
-    """Get database statistics"""
-    if not graph_db:
-        raise HTTPException(status_code=500, detail="Database not connected")
+@cached(ttl=60, maxsize=512)
+async def _full_graph_payload():
+    """Build the /api/graph/full JSON body and its ETag"""
+    driver = await get_driver()
     
     try:
-        with graph_db.db.driver.session() as session:
-            stats_query = """
-            MATCH (c:Class)
-            OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
-            OPTIONAL MATCH (m)-[r:METHOD_CALL]->()
-            RETURN count(DISTINCT c) as total_classes,
-                   count(DISTINCT m) as total_methods,
-                   count(r) as total_method_calls
-            """
-            result = session.run(stats_query)
-            stats_record = result.single()
+        class_records, call_records = await asyncio.gather(
+            _fetch_all(driver, _Q_GRAPH_NODES),
+            _fetch_all(driver, _Q_GRAPH_EDGES)
+        )
+        
+        # Plain dicts straight to orjson: this payload is too large to pay for
+        # response model validation, FullGraphResponse only documents the shape
+        nodes = []
+        edges = []
+        total_methods = 0
+        for c in class_records:
+            nodes.append({"id": c["id"], "label": c["name"], "type": "class", "visibility": c["visibility"], "file_path": c["file_path"]})
+            for m in c["methods"]:
+                nodes.append({"id": m["id"], "label": m["name"], "type": "method", "visibility": m["visibility"], "file_path": None})
+                edges.append({"source": c["id"], "target": m["id"], "type": "HAS_METHOD"})
+            total_methods += len(c["methods"])
+        
+        edges.extend(
+            {"source": call["source"], "target": call["target"], "type": "METHOD_CALL"}
+            for call in call_records
+        )
+        
+        content = orjson.dumps({
+            "nodes": nodes,
+            "edges": edges,
+            "stats": {"total_classes": len(class_records), "total_methods": total_methods}
+        })
+        return _etag(content), content
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/graph/full", response_model=None, responses={200: {"model": FullGraphResponse}})
+async def get_full_graph(request: Request):
+    """Get every class, method and method call as a node/edge graph"""
+    etag, content = await _full_graph_payload()
+    return _etag_response(request, etag, content)
+
+@app.get("/api/graph/full.ndjson")
+async def stream_full_graph():
+    """Stream the full graph as NDJSON: one node or edge object per line"""
+    driver = await get_driver()
+    
+    async def generate():
+        # Rows are forwarded as Neo4j produces them, so memory stays flat
+        # regardless of graph size
+        async with driver.session(database=Config.NEO4J_DATABASE, default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_Q_GRAPH_NODES)
+            async for c in result:
+                yield orjson.dumps({"id": c["id"], "label": c["name"], "type": "class", "visibility": c["visibility"], "file_path": c["file_path"]}) + b"\n"
+                for m in c["methods"]:
+                    yield orjson.dumps({"id": m["id"], "label": m["name"], "type": "method", "visibility": m["visibility"], "file_path": None}) + b"\n"
+                    yield orjson.dumps({"source": c["id"], "target": m["id"], "type": "HAS_METHOD"}) + b"\n"
             
-            return StatsResponse(
-                total_classes=stats_record["total_classes"],
-                total_methods=stats_record["total_methods"],
-                total_method_calls=stats_record["total_method_calls"]
-            )
+            result = await session.run(_Q_GRAPH_EDGES)
+            async for call in result:
+                yield orjson.dumps({"source": call["source"], "target": call["target"], "type": "METHOD_CALL"}) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@cached(ttl=60, maxsize=512)
+async def _stats_payload():
+    """Build the /api/stats JSON body and its ETag"""
+    driver = await get_driver()
+    
+    try:
+        stats_record = (await _fetch_all(driver, _Q_STATS))[0]
+        
+        stats = _fast(StatsResponse,
+            total_classes=stats_record["total_classes"],
+            total_methods=stats_record["total_methods"],
+            total_method_calls=stats_record["total_method_calls"]
+        )
+        content = stats.model_dump_json().encode()
+        return _etag(content), content
     
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in stats endpoint: {e}")
         raise HTTPException(status_code=500, detail="Database query failed")
 
+@app.get("/api/stats", response_model=StatsResponse)
+async def get_stats(request: Request):
+    """Get database statistics"""
+    etag, content = await _stats_payload()
+    return _etag_response(request, etag, content)
+
+@cached(ttl=60, maxsize=512)
+async def _fetch_call_tree(class_name: str, method_name: str, max_depth: int, limit: int, offset: int) -> Dict[str, Any]:
+    """Run the (blocking) call tree traversal in a worker thread"""
+    db = await get_db()
+    
+    try:
+        started = time.perf_counter()
+        result = await asyncio.to_thread(db.db.get_method_call_tree, class_name, method_name, max_depth, limit, offset)
+        elapsed = time.perf_counter() - started
+        if elapsed > SLOW_QUERY_SECONDS:
+            print(f"🐢 Slow call-tree query for {class_name}.{method_name} (max_depth={max_depth}): {elapsed:.2f}s")
+        return result
+    
+    except ClientError as e:
+        if "TransactionTimedOut" in (e.code or ""):
+            raise HTTPException(status_code=504, detail="Call tree query timed out - try a smaller max_depth or a more specific method")
+        print(f"Error in call-tree endpoint for {class_name}.{method_name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get call tree: {str(e)}")
+    except Exception as e:
+        print(f"Error in call-tree endpoint for {class_name}.{method_name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get call tree: {str(e)}")
+
 @app.get("/api/call-tree/{class_name}/{method_name}", response_model=CallTreeResponse)
-async def get_method_call_tree(class_name: str, method_name: str, max_depth: int = 5):
-    """Get hierarchical call tree for a specific method"""
-    if not graph_db:
-        raise HTTPException(status_code=500, detail="Database not connected")
+async def get_method_call_tree(class_name: str, method_name: str, max_depth: int = Query(5, ge=1, le=15), limit: int = 5000, offset: int = 0):
+    """Get hierarchical call tree for a specific method, paginated by tree rows via next_cursor"""
+    await require_known(class_name, method_name)
     
-    if max_depth > 15:
-        raise HTTPException(status_code=400, detail="Maximum depth cannot exceed 15 for tree visualization")
+    if limit < 1 or limit > 5000 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 5000 and offset must not be negative")
     
-    try:
-        result = graph_db.db.get_method_call_tree(class_name, method_name, max_depth)
+    result = await _fetch_call_tree(class_name, method_name, max_depth, limit, offset)
+    
+    async def generate():
+        # One depth level is converted and serialized at a time, so only that
+        # level's CallTreeNode objects and JSON are held in memory
+        build_node = CallTreeNode.model_construct
+        get_fields = _TREE_NODE_FIELDS
         
-        # Transform tree data to match response model
-        tree_data = {}
-        for depth_key, nodes in result["tree"].items():
+        yield b'{"root":%s,"tree":{' % orjson.dumps(result["root"])
+        for index, (depth_key, nodes) in enumerate(result["tree"].items()):
             tree_nodes = []
             for node in nodes:
-                tree_nodes.append(CallTreeNode(
-                    class_name=node["class"],
-                    method=node["method"],
-                    visibility=node["visibility"],
-                    file_path=node["file_path"],
-                    calls=node["calls"]
+                node_class, method, visibility, file_path, calls = get_fields(node)
+                tree_nodes.append(build_node(
+                    class_name=node_class,
+                    method=method,
+                    visibility=visibility,
+                    file_path=file_path,
+                    calls=calls
                 ))
-            tree_data[depth_key] = tree_nodes
+            yield b'%s%s:%s' % (b"," if index else b"", orjson.dumps(depth_key), _TREE_LEVEL_ADAPTER.dump_json(tree_nodes))
+        yield b'},"max_depth":%d,"next_cursor":%s}' % (result["max_depth"], orjson.dumps(result["next_cursor"]))
+    
+    return StreamingResponse(generate(), media_type="application/json")
+
+@cached(ttl=60, maxsize=512)
+async def _call_statistics_payload(class_name: Optional[str], limit: int, after: Optional[str]) -> bytes:
+    """Build the /api/call-statistics JSON body"""
+    db = await get_db()
+    
+    try:
+        result = await asyncio.to_thread(db.db.get_call_statistics, class_name, limit=limit, after=after)
+        
+        build_stats = MethodStatistics.model_construct
+        get_fields = _METHOD_STATISTICS_FIELDS
+        methods = []
+        for method in result["methods"]:
+            method_class, method_name, visibility, calls_made, called_by = get_fields(method)
+            methods.append(build_stats(
+                class_name=method_class,
+                method=method_name,
+                visibility=visibility,
+                calls_made=calls_made,
+                called_by=called_by
+            ))
         
-        return CallTreeResponse(
-            root=result["root"],
-            tree=tree_data,
-            max_depth=result["max_depth"]
+        response = _fast(CallStatisticsResponse,
+            class_filter=result["class_filter"],
+            methods=methods,
+            summary=result["summary"],
+            next_cursor=result["next_cursor"]
         )
+        return response.model_dump_json().encode()
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error in call-tree endpoint for {class_name}.{method_name}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get call tree: {str(e)}")
+        print(f"Error in call-statistics endpoint: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get call statistics: {str(e)}")
+
+@app.get("/api/call-statistics", response_model=CallStatisticsResponse)
+async def get_call_statistics(class_name: Optional[str] = None, limit: int = 500, after: Optional[str] = None):
+    """Get per-method call statistics; pass next_cursor back as `after` for the following page"""
+    if limit < 1 or limit > 5000:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 5000")
+    if class_name is not None:
+        await require_known(class_name)
+    
+    content = await _call_statistics_payload(class_name, limit, after)
+    return Response(content=content, media_type="application/json")
 
 @app.get("/api/class/{class_name}/reviews", response_model=ClassReviewsResponse)
 async def get_class_reviews(class_name: str):
     """Get all methods and their reviews for a specific class"""
-    if not graph_db:
-        raise HTTPException(status_code=500, detail="Database not connected")
+    await require_known(class_name)
+    driver = await get_driver()
     
     try:
-        with graph_db.db.driver.session() as session:
-            # Get class info
-            class_query = """
-            MATCH (c:Class {name: $class_name})
-            RETURN c.name as name, 
-                   c.file_path as file_path, 
-                   c.visibility as visibility
-            """
-            class_result = session.run(class_query, class_name=class_name)
-            class_record = class_result.single()
-            
-            if not class_record:
-                raise HTTPException(status_code=404, detail="Class not found")
-            
-            # Get methods and their reviews
-            methods_query = """
-            MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
-            OPTIONAL MATCH (m)-[:HAS_REVIEW]->(r:Review)
-            RETURN m.name as method_name,
-                   m.visibility as method_visibility,
-                   m.definition as method_definition,
-                   collect(
-                       CASE WHEN r IS NOT NULL THEN {
-                           method_name: r.method_name,
-                           class_name: r.class_name,
-                           severity: r.severity,
-                           issue_type: r.issue_type,
-                           description: r.description,
-                           recommendation: r.recommendation,
-                           line_reference: r.line_reference,
-                           created_at: toString(r.created_at)
-                       } ELSE null END
-                   ) as reviews
-            ORDER BY m.name
-            """
-            methods_result = session.run(methods_query, class_name=class_name)
-            
-            methods = []
-            total_reviews = 0
-            
-            for method_record in methods_result:
-                # Filter out null reviews and convert to ReviewInfo objects
-                raw_reviews = [r for r in method_record["reviews"] if r is not None]
-                reviews = [ReviewInfo(**review) for review in raw_reviews]
-                total_reviews += len(reviews)
-                
-                methods.append(MethodWithReviews(
-                    name=method_record["method_name"],
-                    visibility=method_record["method_visibility"],
-                    definition=method_record["method_definition"],
-                    reviews=reviews
-                ))
+        records = await _fetch_all(driver, _Q_CLASS_REVIEWS, class_name=class_name)
+        
+        if not records:
+            raise HTTPException(status_code=404, detail="Class not found")
+        class_record = records[0]
+        
+        methods = []
+        total_reviews = 0
+        
+        for method in class_record["methods"]:
+            reviews = [ReviewInfo(**review) for review in method["reviews"]]
+            total_reviews += len(reviews)
             
-            return ClassReviewsResponse(
-                class_name=class_record["name"],
-                file_path=class_record["file_path"],
-                visibility=class_record["visibility"],
-                methods=methods,
-                total_methods=len(methods),
-                total_reviews=total_reviews
-            )
+            methods.append(_fast(MethodWithReviews,
+                name=method["name"],
+                visibility=method["visibility"],
+                definition=method["definition"],
+                reviews=reviews
+            ))
+        
+        response = _fast(ClassReviewsResponse,
+            class_name=class_record["name"],
+            file_path=class_record["file_path"],
+            visibility=class_record["visibility"],
+            methods=methods,
+            total_methods=len(methods),
+            total_reviews=total_reviews
+        )
+        return Response(content=response.model_dump_json(), media_type="application/json", headers=_CACHE_HEADERS)
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/")
-async def root():
-    """Serve the main UI"""
-    static_dir = os.path.join(os.path.dirname(__file__), "static")
-    index_path = os.path.join(static_dir, "index.html")
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss counters for the endpoint caches"""
+    return {
+        name: {"hits": cache.hits, "misses": cache.misses, "size": len(cache.entries)}
+        for name, cache in _caches.items()
+    }
+
+@app.post("/api/cache/clear")
+async def clear_cache(request: Request):
+    """Clear the endpoint caches of every worker and reload their name indexes
     
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
-    else:
+    Renews the graph's generation stamp, which the other workers pick up within
+    GENERATION_CHECK_INTERVAL seconds. Requires the X-Admin-Token header when
+    ADMIN_TOKEN is set, and a loopback client otherwise.
+    """
+    if ADMIN_TOKEN:
+        if not secrets.compare_digest(request.headers.get("x-admin-token", ""), ADMIN_TOKEN):
+            raise HTTPException(status_code=403, detail="Invalid admin token")
+    elif request.client is None or request.client.host not in ("127.0.0.1", "::1", "localhost"):
+        raise HTTPException(status_code=403, detail="Cache clearing is only allowed from localhost unless ADMIN_TOKEN is set")
+    
+    driver = await get_driver()
+    async with driver.session(database=Config.NEO4J_DATABASE) as session:
+        await session.execute_write(lambda tx: _collect_records(tx, _Q_MARK_GRAPH_CHANGED, {}))
+    
+    app.state.graph_generation = await read_graph_generation()
+    app.state.generation_checked_at = time.monotonic()
+    clear_caches()
+    await load_name_index()
+    return {"status": "cleared", "scope": "all workers", "pid": os.getpid()}
+
+# The UI is served by StaticFiles at "/" (index.html for the root, with ETag/304
+# handling). Mounted after all routes so the API and docs routes match first
+if os.path.exists(static_dir):
+    app.mount("/", StaticFiles(directory=static_dir, html=True), name="ui")
+else:
+    @app.get("/")
+    async def root():
+        """Point to the API docs when the UI isn't available"""
         return {"message": "CodePecker API is running. UI not found. Visit /docs for API documentation."}
 
 # TODO: Add NetworkX-based graph visualization endpoints
@@ -431,6 +1034,8 @@ async def root():
 # - Real-time layout switching
 def open_browser():
     """Open the default web browser to the UI after a short delay"""
+    import webbrowser  # only needed by the launching process, not by each worker
+    
     time.sleep(2)  # Wait for server to start
     webbrowser.open("http://localhost:8000")
 
@@ -443,10 +1048,16 @@ def main():
     print("📊 API endpoints available:")
     print("   GET /api/health - Health check")
     print("   GET /api/classes - List all classes")
+    print("   GET /api/classes/stream - Stream all classes as NDJSON")
     print("   GET /api/class/{name}/graph - Get class graph")
     print("   GET /api/class/{name}/reviews - Get class methods with reviews")
-    print("   GET /api/call-tree/{name}/{method}?max_depth=5 - Get hierarchical call tree")
+    print("   GET /api/graph/full - Get complete graph data")
+    print("   GET /api/graph/full.ndjson - Stream complete graph as NDJSON")
+    print("   GET /api/call-tree/{name}/{method}?max_depth=5&limit=5000&offset=0 - Get hierarchical call tree")
     print("   GET /api/stats - Database statistics")
+    print("   GET /api/call-statistics?class_name=&limit=500&after= - Paginated per-method call statistics")
+    print("   GET /api/cache/stats - Endpoint cache hit/miss counters")
+    print("   POST /api/cache/clear - Clear endpoint caches in every worker (localhost or ADMIN_TOKEN)")
     print("   GET /docs - Swagger UI documentation")
     print("   GET /redoc - ReDoc documentation")
     print()
@@ -457,13 +1068,23 @@ def main():
     browser_thread.daemon = True
     browser_thread.start()
     
+    # DEV=1 enables auto-reload (single process); otherwise run one worker per core.
+    # Each worker runs the lifespan handler and so opens its own Neo4j driver and cache.
+    dev_mode = os.getenv("DEV", "0") == "1"
+    workers = 1 if dev_mode else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+    print(f"⚙️  Mode: {'development (auto-reload)' if dev_mode else f'production ({workers} workers)'}")
+    
     # Start the FastAPI server with Uvicorn
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes
-        log_level="info"
+        reload=dev_mode,  # Auto-reload on code changes
+        workers=workers,
+        loop="auto",  # uvloop when installed (uvicorn[standard])
+        http="auto",  # httptools when installed
+        log_level="info" if dev_mode else "warning",
+        access_log=dev_mode  # per-request access logging only while developing
     )
 
 if __name__ == '__main__':
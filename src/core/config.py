@@ -2,7 +2,9 @@
 Configuration settings for the codebase analyzer
 """
 import os
-from typing import Dict, Any
+import functools
+from types import MappingProxyType
+from typing import Mapping, Any
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -20,6 +22,16 @@ class Config:
     NEO4J_USERNAME = os.getenv("NEO4J_USERNAME", "neo4j")
     NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password")
     NEO4J_CLEAR_DB = os.getenv("NEO4J_CLEAR_DB", "true").lower() == "true"
+    NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
+    
+    # Neo4j driver connection pool settings
+    NEO4J_POOL_SIZE = int(os.getenv("NEO4J_POOL_SIZE", "100"))
+    NEO4J_ACQUIRE_TIMEOUT = float(os.getenv("NEO4J_ACQUIRE_TIMEOUT", "60"))  # seconds
+    NEO4J_MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))  # seconds
+    NEO4J_MAX_RETRY_TIME = float(os.getenv("NEO4J_MAX_RETRY_TIME", "30"))  # seconds
+    
+    # Parsing results of unchanged files are reused from this SQLite file across runs (unset disables it)
+    PARSE_CACHE_PATH = os.getenv("CODEPECKER_PARSE_CACHE") or None
     
     # Memgraph specific settings
     MEMGRAPH_HOST = os.getenv("CODEPECKER_MEMGRAPH_HOST", "localhost")
@@ -31,28 +43,39 @@ class Config:
     ARANGODB_PASSWORD = os.getenv("CODEPECKER_ARANGODB_PASSWORD", "")
     
     @classmethod
-    def get_database_config(cls) -> Dict[str, Any]:
-        """Get database configuration based on the selected database type"""
+    @functools.lru_cache(maxsize=1)
+    def get_database_config(cls) -> Mapping[str, Any]:
+        """Get database configuration based on the selected database type
+        
+        The result is computed once and returned as a read-only mapping; callers
+        that need different settings should override them in a copy, e.g.
+        {**Config.get_database_config(), "clear_db": False}.
+        """
         db_type = cls.DATABASE_TYPE.lower()
         
         if db_type == "neo4j":
-            return {
+            return MappingProxyType({
                 "uri": cls.NEO4J_URI,
                 "username": cls.NEO4J_USERNAME,
                 "password": cls.NEO4J_PASSWORD,
-                "clear_db": cls.NEO4J_CLEAR_DB
-            }
+                "clear_db": cls.NEO4J_CLEAR_DB,
+                "database": cls.NEO4J_DATABASE,
+                "max_connection_pool_size": cls.NEO4J_POOL_SIZE,
+                "connection_acquisition_timeout": cls.NEO4J_ACQUIRE_TIMEOUT,
+                "max_connection_lifetime": cls.NEO4J_MAX_CONNECTION_LIFETIME,
+                "max_transaction_retry_time": cls.NEO4J_MAX_RETRY_TIME
+            })
         elif db_type == "memgraph":
-            return {
+            return MappingProxyType({
                 "host": cls.MEMGRAPH_HOST,
                 "port": cls.MEMGRAPH_PORT
-            }
+            })
         elif db_type == "arangodb":
-            return {
+            return MappingProxyType({
                 "url": cls.ARANGODB_URL,
                 "username": cls.ARANGODB_USERNAME,
                 "password": cls.ARANGODB_PASSWORD
-            }
+            })
         else:
             raise ValueError(f"Unsupported database type: {db_type}. Currently supported: neo4j")
 
@@ -1,13 +1,15 @@
 """
 Placeholder implementations for other graph databases (future development)
 """
-from typing import Dict, Any, Union, List
-from .graph_db_interface import GraphDatabaseInterface
+from typing import Dict, Any, List
+from .graph_db_interface import GraphDatabaseInterface, NodeId
 
 
 class MemgraphGraphDB(GraphDatabaseInterface):
     """Memgraph implementation for storing static call stack graph (placeholder)"""
     
+    __slots__ = ("host", "port", "driver")
+    
     def __init__(self, host: str = "localhost", port: int = 7687):
         """Initialize Memgraph connection"""
         self.host = host
@@ -19,25 +21,27 @@ class MemgraphGraphDB(GraphDatabaseInterface):
     
     def initialize(self):
         """Initialize the Memgraph database schema"""
-        # TODO: Create indexes and constraints in Memgraph
+        # TODO: Create indexes and constraints in Memgraph before any data is imported,
+        # otherwise every MERGE during a batched import does a full label scan:
+        # CREATE INDEX ON :Class(name); CREATE INDEX ON :Class(file_path); CREATE INDEX ON :Method(name)
         pass
     
-    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> Union[int, str]:
+    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> NodeId:
         """Add a class node to the graph"""
         # TODO: Implement Memgraph class creation (similar to Neo4j)
         return "0"  # Placeholder
     
-    def add_method(self, method_name: str, visibility: str, parent_class_id: Union[int, str], method_calls: List[str] = None, definition: str = None) -> Union[int, str]:
+    def add_method(self, method_name: str, visibility: str, parent_class_id: NodeId, method_calls: List[str] = None, definition: str = None) -> NodeId:
         """Add a method node to the graph under a class"""
         # TODO: Implement Memgraph method creation
         return "0"  # Placeholder
     
-    def add_method_call(self, method_id: Union[int, str], called_method_name: str):
+    def add_method_call(self, method_id: NodeId, called_method_name: str):
         """Add a method call relationship"""
         # TODO: Implement Memgraph method call relationship
         pass
     
-    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]]):
+    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]], bulk: bool = False):
         """Store the parsing results in the graph database"""
         # TODO: Implement Memgraph storage logic
         pass
@@ -56,6 +60,8 @@ class MemgraphGraphDB(GraphDatabaseInterface):
 class ArangoDBGraphDB(GraphDatabaseInterface):
     """ArangoDB implementation for storing static call stack graph (placeholder)"""
     
+    __slots__ = ("url", "username", "password", "client", "db")
+    
     def __init__(self, url: str = "http://localhost:8529", username: str = "root", password: str = ""):
         """Initialize ArangoDB connection"""
         self.url = url
@@ -72,22 +78,22 @@ class ArangoDBGraphDB(GraphDatabaseInterface):
         # TODO: Create collections for nodes and edges
         pass
     
-    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> Union[int, str]:
+    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> NodeId:
         """Add a class node to the graph"""
         # TODO: Implement ArangoDB document creation
         return "0"  # Placeholder
     
-    def add_method(self, method_name: str, visibility: str, parent_class_id: Union[int, str], method_calls: List[str] = None, definition: str = None) -> Union[int, str]:
+    def add_method(self, method_name: str, visibility: str, parent_class_id: NodeId, method_calls: List[str] = None, definition: str = None) -> NodeId:
         """Add a method node to the graph under a class"""
         # TODO: Implement ArangoDB document and edge creation
         return "0"  # Placeholder
     
-    def add_method_call(self, method_id: Union[int, str], called_method_name: str):
+    def add_method_call(self, method_id: NodeId, called_method_name: str):
         """Add a method call relationship"""
         # TODO: Implement ArangoDB edge creation for method calls
         pass
     
-    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]]):
+    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]], bulk: bool = False):
         """Store the parsing results in the graph database"""
         # TODO: Implement ArangoDB storage logic
         pass
@@ -106,6 +112,8 @@ class ArangoDBGraphDB(GraphDatabaseInterface):
 class TigerGraphDB(GraphDatabaseInterface):
     """TigerGraph implementation for storing static call stack graph (placeholder)"""
     
+    __slots__ = ("host", "port", "username", "password", "conn")
+    
     def __init__(self, host: str = "localhost", port: int = 9000, username: str = "tigergraph", password: str = "password"):
         """Initialize TigerGraph connection"""
         self.host = host
@@ -122,22 +130,22 @@ class TigerGraphDB(GraphDatabaseInterface):
         # TODO: Create graph schema, vertex types, and edge types
         pass
     
-    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> Union[int, str]:
+    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> NodeId:
         """Add a class node to the graph"""
         # TODO: Implement TigerGraph vertex creation
         return "0"  # Placeholder
     
-    def add_method(self, method_name: str, visibility: str, parent_class_id: Union[int, str], method_calls: List[str] = None, definition: str = None) -> Union[int, str]:
+    def add_method(self, method_name: str, visibility: str, parent_class_id: NodeId, method_calls: List[str] = None, definition: str = None) -> NodeId:
         """Add a method node to the graph under a class"""
         # TODO: Implement TigerGraph method vertex and edge creation
         return "0"  # Placeholder
     
-    def add_method_call(self, method_id: Union[int, str], called_method_name: str):
+    def add_method_call(self, method_id: NodeId, called_method_name: str):
         """Add a method call relationship"""
         # TODO: Implement TigerGraph edge creation for method calls
         pass
     
-    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]]):
+    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]], bulk: bool = False):
         """Store the parsing results in the graph database"""
         # TODO: Implement TigerGraph storage logic
         pass
@@ -1,18 +1,52 @@
 """
 Factory for creating graph database instances
 """
-from typing import Dict, Any, Union, List
-from .graph_db_interface import GraphDatabaseInterface
-from .neo4j_graph_db import Neo4jGraphDB
+import asyncio
+import functools
+import importlib
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple, Iterator
+from .graph_db_interface import GraphDatabaseInterface, NodeId
+
+# Backend implementations as "module:Class" within this package; modules are imported
+# on first use so the driver of an unused backend is never loaded
+_REGISTRY = {
+    "neo4j": "neo4j_graph_db:Neo4jGraphDB",
+    # Future implementations can be added here once they implement the full interface:
+    # "memgraph": "future_graph_dbs:MemgraphGraphDB",
+    # "arangodb": "future_graph_dbs:ArangoDBGraphDB",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _backend_class(db_type: str) -> type:
+    """Resolve a registered db_type to its backend class, importing its module on first use"""
+    target = _REGISTRY.get(db_type)
+    if target is None:
+        raise ValueError(f"Unsupported database type: {db_type}. Currently supported: {', '.join(_REGISTRY)}")
+    
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(f".{module_name}", __package__), class_name)
 
 
 class GraphDatabaseFactory:
     """Factory class for creating graph database instances"""
     
-    @staticmethod
-    def create_database(db_type: str = "neo4j", **kwargs) -> GraphDatabaseInterface:
+    # Live instances keyed by db_type plus connection settings, so wrappers created with the
+    # same configuration share one driver and its connection pool
+    _instances: Dict[Tuple, GraphDatabaseInterface] = {}
+    # Number of callers holding each cached instance, by key
+    _refcounts: Dict[Tuple, int] = {}
+    # Traversal memo and pending-call buffer of each cached instance, by key; every
+    # wrapper over the same instance uses the same pair, so a write through one of
+    # them invalidates and flushes for all
+    _shared_state: Dict[Tuple, Tuple["OrderedDict[Tuple, Any]", List[Tuple[NodeId, str]]]] = {}
+    
+    @classmethod
+    def create_database(cls, db_type: str = "neo4j", **kwargs) -> GraphDatabaseInterface:
         """
-        Create a graph database instance based on the specified type
+        Create a graph database instance based on the specified type, reusing a live one if possible
         
         Args:
             db_type: Type of database ("neo4j", "memgraph", etc.)
@@ -20,29 +54,69 @@ class GraphDatabaseFactory:
             
         Returns:
             GraphDatabaseInterface implementation
+            
+        Note:
+            clear_db only takes effect when a new instance is built, so pass clear_db=True
+            on the first call only; later calls with the same settings get the shared instance.
+            Every call must be paired with a release() once the caller is done with it.
         """
         db_type = db_type.lower()
+        key = (db_type,) + tuple(sorted((k, v) for k, v in kwargs.items() if k != "clear_db"))
         
-        if db_type == "neo4j":
-            uri = kwargs.get("uri", "bolt://localhost:7687")
-            username = kwargs.get("username", "neo4j")
-            password = kwargs.get("password", "password")
-            clear_db = kwargs.get("clear_db", True)
-            return Neo4jGraphDB(uri=uri, username=username, password=password, clear_db=clear_db)
-        
-        # Future implementations can be added here:
-        # elif db_type == "memgraph":
-        #     return MemgraphGraphDB(**kwargs)
-        # elif db_type == "arangodb":
-        #     return ArangoDBGraphDB(**kwargs)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = cls._build(db_type, **kwargs)
+        cls._refcounts[key] = cls._refcounts.get(key, 0) + 1
+        return instance
+    
+    @classmethod
+    def release(cls, instance: GraphDatabaseInterface) -> bool:
+        """
+        Drop one reference to an instance from create_database
         
-        else:
-            raise ValueError(f"Unsupported database type: {db_type}. Currently supported: neo4j")
+        Returns:
+            True when that was the last reference; the instance is then forgotten
+            and the caller should close it
+        """
+        for key, cached in list(cls._instances.items()):
+            if cached is instance:
+                cls._refcounts[key] -= 1
+                if cls._refcounts[key] > 0:
+                    return False
+                del cls._instances[key]
+                del cls._refcounts[key]
+                cls._shared_state.pop(key, None)
+                return True
+        # Not cached (already released everywhere), so nobody else shares it
+        return True
+    
+    @classmethod
+    def close_all(cls):
+        """Close every cached instance"""
+        for instance in list(cls._instances.values()):
+            instance.close()
+        cls._instances.clear()
+        cls._refcounts.clear()
+        cls._shared_state.clear()
+    
+    @classmethod
+    def shared_state(cls, instance: GraphDatabaseInterface) -> Tuple["OrderedDict[Tuple, Any]", List[Tuple[NodeId, str]]]:
+        """The (traversal memo, pending-call buffer) pair shared by every wrapper over instance"""
+        for key, cached in cls._instances.items():
+            if cached is instance:
+                return cls._shared_state.setdefault(key, (OrderedDict(), []))
+        # An instance that isn't cached has no other wrappers to share with
+        return OrderedDict(), []
+    
+    @staticmethod
+    def _build(db_type: str, **kwargs) -> GraphDatabaseInterface:
+        """Build a new graph database instance for the specified type"""
+        return _backend_class(db_type)(**kwargs)
     
     @staticmethod
     def get_supported_databases() -> list:
         """Get list of supported database types"""
-        return ["neo4j"]  # Add more as they're implemented
+        return list(_REGISTRY)
 
 
 # Backward compatibility wrapper
@@ -51,6 +125,8 @@ class CallStackGraphDB:
     Backward compatibility wrapper for the original CallStackGraphDB class
     """
     
+    __slots__ = ("db", "_traversal_cache", "_traversal_cache_size", "_traversal_cache_ttl", "_pending_calls", "_flush_threshold", "_closed")
+    
     def __init__(self, db_type: str = "neo4j", **kwargs):
         """
         Initialize with specified database type
@@ -60,56 +136,154 @@ class CallStackGraphDB:
             **kwargs: Database-specific configuration parameters
         """
         self.db = GraphDatabaseFactory.create_database(db_type, **kwargs)
+        # Both are shared with other wrappers over the same backend instance (see
+        # GraphDatabaseFactory.shared_state), so they are only ever mutated in place.
+        # _traversal_cache: traversal results keyed by their arguments, cleared by any
+        # write made through a wrapper over this backend. Writes it can't see (from
+        # another process, or through self.db directly) are only picked up once an
+        # entry is older than _traversal_cache_ttl seconds. Least recently used entries
+        # are evicted beyond _traversal_cache_size.
+        # _pending_calls: (method_id, called_method_name) pairs buffered by
+        # add_method_call and written in one batched transaction per _flush_threshold calls
+        self._traversal_cache, self._pending_calls = GraphDatabaseFactory.shared_state(self.db)
+        self._traversal_cache_size = 512
+        self._traversal_cache_ttl = 60.0
+        self._flush_threshold = 1000
+        self._closed = False
+    
+    def flush(self):
+        """Write any buffered method call relationships"""
+        if self._pending_calls:
+            pending = self._pending_calls[:]
+            self._pending_calls.clear()
+            self.db.add_method_calls(pending)
+    
+    def clear_traversal_cache(self):
+        """Drop all memoized call stack traversals (for every wrapper over this backend)"""
+        self._traversal_cache.clear()
     
     def init_database(self):
         """Initialize the database schema (for backward compatibility)"""
         self.db.initialize()
     
-    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> Union[int, str]:
+    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> NodeId:
         """Add a class node to the graph"""
+        self._traversal_cache.clear()
         return self.db.add_class(class_name, file_path, visibility)
     
-    def add_method(self, method_name: str, visibility: str, parent_class_id: Union[int, str], method_calls: List[str] = None, definition: str = None) -> Union[int, str]:
+    def add_method(self, method_name: str, visibility: str, parent_class_id: NodeId, method_calls: List[str] = None, definition: str = None) -> NodeId:
         """Add a method node to the graph under a class"""
+        self._traversal_cache.clear()
         return self.db.add_method(method_name, visibility, parent_class_id, method_calls, definition)
     
-    def add_method_call(self, method_id: Union[int, str], called_method_name: str):
-        """Add a method call relationship"""
-        return self.db.add_method_call(method_id, called_method_name)
+    def add_method_call(self, method_id: NodeId, called_method_name: str):
+        """Add a method call relationship (buffered; written on flush or when the buffer fills)"""
+        self._traversal_cache.clear()
+        self._pending_calls.append((method_id, called_method_name))
+        if len(self._pending_calls) >= self._flush_threshold:
+            self.flush()
     
     def create_method_call_relationship(self, calling_class: str, calling_method: str, 
                                       target_class: str, target_method: str, call_type: str = "METHOD_CALL"):
         """Create a relationship between methods in different classes"""
+        self._traversal_cache.clear()
         return self.db.create_method_call_relationship(calling_class, calling_method, target_class, target_method, call_type)
     
+    def create_method_call_relationships(self, relationships: List[Dict[str, str]]):
+        """Create many cross-class method call relationships in batches"""
+        self._traversal_cache.clear()
+        return self.db.create_method_call_relationships(relationships)
+    
+    def _memoized(self, key: Tuple, fetch) -> Dict[str, Any]:
+        """
+        Return the cached traversal for key, fetching and caching it on a miss
+        
+        A result reflects every write made through wrappers over this backend in this
+        process. Other writes (another process such as ingestion.py, or self.db used
+        directly) show up after at most _traversal_cache_ttl seconds.
+        """
+        cache = self._traversal_cache
+        entry = cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            cache.move_to_end(key)
+            return entry[1]
+        self.flush()
+        result = fetch()
+        cache[key] = (now + self._traversal_cache_ttl, result)
+        if len(cache) > self._traversal_cache_size:
+            cache.popitem(last=False)
+        return result
+    
     def get_call_stack(self, class_name: str) -> Dict[str, Any]:
-        """Get the complete call stack for a specific class"""
-        return self.db.get_call_stack(class_name)
+        """Get the complete call stack for a specific class (memoized, see _memoized)"""
+        return self._memoized((class_name, ""), lambda: self.db.get_call_stack(class_name))
     
     def get_method_call_stack(self, class_name: str, method_name: str) -> Dict[str, Any]:
-        """Get the call stack for a specific method in a class"""
-        return self.db.get_method_call_stack(class_name, method_name)
+        """Get the call stack for a specific method in a class (memoized, see _memoized)"""
+        return self._memoized((class_name, method_name), lambda: self.db.get_method_call_stack(class_name, method_name))
     
-    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]]):
-        """Store the parsing results in the graph database"""
-        self.db.store_parsing_results(parsing_results)
+    def get_recursive_call_stack(self, class_name: str, max_depth: int = 10) -> Dict[str, Any]:
+        """Get the call stack of a class up to max_depth hops (memoized, see _memoized)"""
+        return self._memoized((class_name, "", max_depth), lambda: self.db.get_recursive_call_stack(class_name, max_depth))
+
+    def iter_call_stack(self, class_name: str) -> Iterator[Tuple]:
+        """Stream call stack rows for a class without building the nested dict"""
+        self.flush()
+        return self.db.iter_call_stack(class_name)
+
+    def iter_method_call_stack(self, class_name: str, method_name: str) -> Iterator[Tuple]:
+        """Stream call stack rows for a method without building the nested dict"""
+        self.flush()
+        return self.db.iter_method_call_stack(class_name, method_name)
+
+    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]], bulk: bool = False):
+        """Store the parsing results in the graph database (bulk=True loads server-side via APOC)"""
+        self._traversal_cache.clear()
+        self.db.store_parsing_results(parsing_results, bulk=bulk)
+        self.flush()
+    
+    async def store_parsing_results_async(self, parsing_results: Dict[str, Dict[str, Any]]):
+        """Store the parsing results using the backend's async driver (wrap in asyncio.run from sync code)"""
+        self._traversal_cache.clear()
+        await self.db.store_parsing_results_async(parsing_results)
+        await asyncio.to_thread(self.flush)
+    
+    def mark_graph_changed(self):
+        """Write any buffered calls, then tell readers such as the web server that the graph changed"""
+        self.flush()
+        self.db.mark_graph_changed()
     
     def print_graph(self):
         """Print the graph in the specified format"""
+        self.flush()
         self.db.print_graph()
     
     def close(self):
-        """Clean up database connections"""
-        self.db.close()
+        """Clean up database connections; a driver shared with other wrappers is closed by the last one"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if GraphDatabaseFactory.release(self.db):
+            self.db.close()
+
+    def iter_methods_for_review(self, page_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yield methods with their definitions for LLM review, one page at a time"""
+        self.flush()
+        return self.db.iter_methods_for_review(page_size)
 
     def get_all_methods_for_review(self) -> List[Dict[str, Any]]:
-        """Get all methods with their definitions for LLM review"""
+        """Get all methods with their definitions for LLM review (deprecated: use iter_methods_for_review)"""
+        self.flush()
         return self.db.get_all_methods_for_review()
 
     def add_review(self, method_id: str, review_data: Dict[str, Any]) -> str:
         """Add a review node linked to a method"""
+        self._traversal_cache.clear()
         return self.db.add_review(method_id, review_data)
 
-    def clear_existing_reviews(self):
+    def clear_existing_reviews(self, chunk_size: int = 10000):
         """Clear all existing review nodes"""
-        return self.db.clear_existing_reviews()
+        self._traversal_cache.clear()
+        return self.db.clear_existing_reviews(chunk_size)
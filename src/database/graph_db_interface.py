@@ -2,38 +2,55 @@
 Abstract base interface for graph database implementations
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Tuple
+
+# Opaque node identifier returned by add_class/add_method and passed back to the
+# backend that issued it (Neo4j uses elementId strings); callers never inspect it
+NodeId = Union[int, str]
 
 
 class GraphDatabaseInterface(ABC):
     """Abstract interface for graph database implementations"""
     
+    # Empty so that backends declaring __slots__ don't get a per-instance __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def initialize(self):
         """Initialize the database schema"""
         pass
     
     @abstractmethod
-    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> Union[int, str]:
+    def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> NodeId:
         """Add a class node to the graph"""
         pass
     
     @abstractmethod
-    def add_method(self, method_name: str, visibility: str, parent_class_id: Union[int, str], method_calls: List[str] = None, definition: str = None) -> Union[int, str]:
+    def add_method(self, method_name: str, visibility: str, parent_class_id: NodeId, method_calls: List[str] = None, definition: str = None) -> NodeId:
         """Add a method node to the graph under a class"""
         pass
     
     @abstractmethod
-    def add_method_call(self, method_id: Union[int, str], called_method_name: str):
+    def add_method_call(self, method_id: NodeId, called_method_name: str):
         """Add a method call relationship"""
         pass
     
+    def add_method_calls(self, calls: List[Tuple[NodeId, str]]):
+        """Add many (method_id, called_method_name) call relationships; backends may batch this"""
+        for method_id, called_method_name in calls:
+            self.add_method_call(method_id, called_method_name)
+    
     @abstractmethod
     def create_method_call_relationship(self, calling_class: str, calling_method: str, 
                                       target_class: str, target_method: str, call_type: str = "METHOD_CALL"):
         """Create a relationship between methods in different classes"""
         pass
     
+    def create_method_call_relationships(self, relationships: List[Dict[str, str]]):
+        """Create many cross-class method call relationships; backends may batch this"""
+        for relationship in relationships:
+            self.create_method_call_relationship(**relationship)
+    
     @abstractmethod
     def get_call_stack(self, class_name: str) -> Dict[str, Any]:
         """Get the complete call stack for a specific class"""
@@ -45,10 +62,14 @@ class GraphDatabaseInterface(ABC):
         pass
     
     @abstractmethod
-    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]]):
+    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]], bulk: bool = False):
         """Store the parsing results in the graph database"""
         pass
     
+    def mark_graph_changed(self):
+        """Record that the graph changed so readers such as the web server drop cached results; optional"""
+        pass
+    
     @abstractmethod
     def print_graph(self):
         """Print the graph in the specified format"""
@@ -2,15 +2,567 @@
 Neo4j implementation of the graph database interface
 """
 import os
-from typing import Dict, Any, List
-from neo4j import GraphDatabase
+import asyncio
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Iterator, Tuple
+from neo4j import GraphDatabase, AsyncGraphDatabase, READ_ACCESS, unit_of_work
+from neo4j.exceptions import ClientError
 from .graph_db_interface import GraphDatabaseInterface
 
+# Traversal queries (call trees/paths) can explode combinatorially on dense
+# graphs; they run with a server-side timeout and capped depth/row counts
+TRAVERSAL_TIMEOUT = 5.0  # seconds
+MAX_TRAVERSAL_DEPTH = 15
+MAX_TREE_PATHS = 1000
+
+# Bulk import statements used by store_parsing_results, written against a
+# single row `r`; they run once per batch of rows (UNWIND) or per APOC batch
+# instead of once per class/method/call. Full statements are assembled once
+# here and only parameters vary per call, so the server's plan cache always
+# hits; don't format labels or values into query text at call time
+_UNWIND_ROWS = "UNWIND $rows AS r"
+
+# Parsing results are shipped column-wise (one parameter list per field) rather
+# than as a list of per-row maps, so field names are not repeated on the wire
+_CLASS_COLUMNS = ("name", "file_path", "visibility")
+_METHOD_COLUMNS = ("class_name", "file_path", "name", "visibility", "method_calls", "definition", "content_hash")
+_CALL_COLUMNS = ("class_name", "method_name", "called_method_name")
+
+# Stored visibility labels for the parser's lowercase keywords; anything else falls back to .title()
+_VISIBILITY_LABELS = {"public": "Public", "private": "Private", "protected": "Protected", "internal": "Internal"}
+
+# Name columns repeat the same few strings across many rows (a popular callee
+# appears in every call row that targets it), so they are sent as indexes into
+# a per-batch $names list instead of one copy per row
+_INTERNED_COLUMNS = frozenset({"class_name", "file_path", "method_name", "called_method_name"})
+
+
+def _unwind_columns(columns) -> str:
+    """Build a prefix that rebuilds row `r` from parallel column parameters"""
+    fields = ", ".join(
+        f"{column}: $names[${column}[i]]" if column in _INTERNED_COLUMNS else f"{column}: ${column}[i]"
+        for column in columns
+    )
+    return f"UNWIND range(0, size(${columns[0]}) - 1) AS i\nWITH {{{fields}}} AS r"
+
+_STORE_CLASSES = """
+MERGE (c:Class {name: r.name, file_path: r.file_path})
+SET c.visibility = r.visibility,
+    c.type = 'Class'
+"""
+
+_STORE_METHODS = """
+MATCH (c:Class {name: r.class_name, file_path: r.file_path})
+MERGE (m:Method {name: r.name, parent_class_name: c.name})
+SET m.visibility = r.visibility,
+    m.type = 'Method',
+    m.method_calls = r.method_calls,
+    m.definition = r.definition,
+    m.content_hash = r.content_hash
+MERGE (c)-[:HAS_METHOD]->(m)
+"""
+
+# Content hashes of methods stored by earlier imports, for skipping unchanged rows
+_STORED_METHOD_HASHES = """
+MATCH (m:Method)
+WHERE m.content_hash IS NOT NULL
+RETURN m.parent_class_name as class_name, m.name as name, m.content_hash as content_hash
+"""
+
+# Links the row's caller `m` to every other method named r.called_method_name. Calls
+# that resolve to nothing get no relationship; the caller's method_calls property
+# already lists every called name, resolved or not
+_RESOLVE_CALL = """
+MATCH (target:Method {name: r.called_method_name})
+WHERE target <> m
+MERGE (m)-[:METHOD_CALL {type: "SIMPLE_CALL"}]->(target)
+"""
+
+_STORE_CALLS = """
+MATCH (m:Method {name: r.method_name, parent_class_name: r.class_name})""" + _RESOLVE_CALL
+
+# Calls added after the method node exists are also recorded in its method_calls
+_ADD_CALLS = """
+MATCH (m:Method) WHERE elementId(m) = r.method_id
+SET m.method_calls = CASE
+    WHEN r.called_method_name IN coalesce(m.method_calls, []) THEN m.method_calls
+    ELSE coalesce(m.method_calls, []) + r.called_method_name
+END
+WITH m, r""" + _RESOLVE_CALL
+
+# retries re-runs a failed batch, as execute_write does on the driver path: parallel
+# method batches MERGE shared Class/Method nodes (partial classes, classes split
+# across batches) and can deadlock
+_APOC_ITERATE = """
+CALL apoc.periodic.iterate($iterate, $action,
+    {batchSize: $batch_size, parallel: $parallel, retries: $retries, params: $columns})
+YIELD failedBatches, errorMessages
+RETURN failedBatches, errorMessages
+"""
+
+# (row prefix, per-row action, safe to write batches in parallel) per import step,
+# in dependency order: classes, then methods, then calls. Class batches touch
+# disjoint nodes, and method rows arrive grouped by class so a class spans at
+# most two batches; call batches MERGE relationships onto widely shared target
+# methods and would contend for locks, so they are written one at a time
+_IMPORT_STEPS = (
+    (_unwind_columns(_CLASS_COLUMNS), _STORE_CLASSES, True),
+    (_unwind_columns(_METHOD_COLUMNS), _STORE_METHODS, True),
+    (_unwind_columns(_CALL_COLUMNS), _STORE_CALLS, False),
+)
+_IMPORT_QUERIES = tuple((prefix + action, parallel) for prefix, action, parallel in _IMPORT_STEPS)
+_ADD_CALLS_QUERY = _UNWIND_ROWS + _ADD_CALLS
+
+# Explicit cross-class call edges; each side is anchored on its class in one
+# pattern so the planner never builds a Cartesian product of the four MATCHes
+_CREATE_CALL_RELATIONSHIPS_QUERY = _UNWIND_ROWS + """
+MATCH (calling_class:Class {name: r.calling_class})-[:HAS_METHOD]->(calling_method:Method {name: r.calling_method})
+MATCH (target_class:Class {name: r.target_class})-[:HAS_METHOD]->(target_method:Method {name: r.target_method})
+MERGE (calling_method)-[:METHOD_CALL {type: coalesce(r.call_type, "METHOD_CALL")}]->(target_method)
+"""
+
+
+# Per-call queries are kept as module constants so every call sends byte-identical
+# text and hits the server's query plan cache
+# Graph-wide stamp the web server polls to notice re-ingestion. A fresh random value
+# rather than a counter, so a wiped and re-ingested graph never repeats an old stamp
+_MARK_GRAPH_CHANGED_QUERY = """
+MERGE (g:GraphMeta {key: 'graph'})
+SET g.generation = randomUUID()
+"""
+
+_ADD_CLASS_QUERY = """
+MERGE (c:Class {name: $name, file_path: $file_path})
+ON CREATE SET 
+    c.visibility = $visibility,
+    c.type = 'Class'
+ON MATCH SET
+    c.visibility = $visibility,
+    c.file_path = $file_path,
+    c.type = 'Class'
+RETURN elementId(c) as class_id
+"""
+
+_ADD_METHOD_QUERY = """
+MATCH (c:Class) WHERE elementId(c) = $parent_class_id
+MERGE (m:Method {name: $name, parent_class_name: c.name})
+ON CREATE SET 
+    m.visibility = $visibility,
+    m.type = 'Method',
+    m.method_calls = $method_calls,
+    m.definition = $definition
+ON MATCH SET
+    m.visibility = $visibility,
+    m.type = 'Method',
+    m.method_calls = $method_calls,
+    m.definition = $definition,
+    m.content_hash = null
+MERGE (c)-[:HAS_METHOD]->(m)
+WITH m
+CALL {
+    WITH m
+    UNWIND $method_calls AS called_method_name
+    MATCH (target:Method {name: called_method_name})
+    WHERE target <> m
+    MERGE (m)-[:METHOD_CALL {type: "SIMPLE_CALL"}]->(target)
+}
+RETURN elementId(m) as method_id
+"""
+
+_CALL_STACK_QUERY = """
+MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
+OPTIONAL MATCH (m)-[:METHOD_CALL]->(target_method:Method)<-[:HAS_METHOD]-(target_class:Class)
+RETURN c.name as class_name, c.file_path as class_file,
+       m.name as method_name, m.visibility as method_visibility,
+       target_class.name as target_class_name, 
+       target_method.name as target_method_name
+ORDER BY method_name, target_class_name, target_method_name
+"""
+
+_METHOD_CALL_STACK_QUERY = """
+MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method {name: $method_name})
+OPTIONAL MATCH (m)-[:METHOD_CALL]->(target_method:Method)<-[:HAS_METHOD]-(target_class:Class)
+WITH target_class, target_method
+WHERE target_class IS NOT NULL AND target_method IS NOT NULL
+MATCH (target_class)-[:HAS_METHOD]->(all_methods:Method)
+OPTIONAL MATCH (all_methods)-[:METHOD_CALL]->(nested_method:Method)<-[:HAS_METHOD]-(nested_class:Class)
+RETURN target_class.name as class_name, target_class.file_path as class_file,
+       all_methods.name as method_name, all_methods.visibility as method_visibility,
+       nested_class.name as target_class_name, 
+       nested_method.name as target_method_name
+ORDER BY class_name, method_name, target_class_name, target_method_name
+"""
+
+# One aggregation query returns every class with its methods and their calls
+_PRINT_GRAPH_QUERY = """
+MATCH (c:Class)
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+OPTIONAL MATCH (m)-[:METHOD_CALL]->(target:Method)<-[:HAS_METHOD]-(target_class:Class)
+WHERE target <> m
+WITH c, m,
+     collect(target_class.name + '.' + target.name) as resolved_calls,
+     collect(target.name) as resolved_names
+// Calls that matched no method are only listed in the method_calls property
+WITH c, m, resolved_calls + [name IN coalesce(m.method_calls, []) WHERE NOT name IN resolved_names] as method_calls
+ORDER BY m.name
+WITH c, collect(CASE WHEN m IS NOT NULL THEN {name: m.name, visibility: m.visibility, calls: method_calls} END) as methods
+RETURN c.name as class_name, 
+       c.file_path as file_path, 
+       c.visibility as class_visibility,
+       methods
+ORDER BY c.name
+"""
+
+# One row per method of the class with every call chain (up to %d hops, the
+# variable-length bound, which cannot be a parameter) collected alongside it
+_RECURSIVE_CALL_STACK_QUERY = """
+MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
+CALL {
+    WITH m
+    MATCH path = (m)-[:METHOD_CALL*1..%d]->(:Method)
+    WITH nodes(path) as call_chain
+    UNWIND range(0, size(call_chain)-1) as i
+    WITH call_chain[i] as method_at_depth, i as depth
+    MATCH (method_at_depth)<-[:HAS_METHOD]-(method_class:Class)
+    WITH method_at_depth, method_class, depth
+    ORDER BY depth, method_class.name, method_at_depth.name
+    RETURN collect({called_class: method_class.name, called_method: method_at_depth.name, depth: depth}) as calls
+}
+RETURN c.name as class_name, c.file_path as file_path,
+       m.name as method_name, m.visibility as method_visibility,
+       calls
+ORDER BY method_name
+"""
+
+# %d is the variable-length depth bound, which cannot be a parameter. Paths are
+# ordered (shortest first, then by the methods along them) before $max_paths cuts
+# them off, so every page sees the same subset. Rows are sorted on every returned
+# column (a method repeats per outgoing call and per path reaching it, and class
+# names repeat across files) so SKIP/LIMIT pages are stable
+_METHOD_CALL_TREE_QUERY = """
+MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(root:Method {name: $method_name})
+CALL {
+    WITH root
+    MATCH path = (root)-[:METHOD_CALL*0..%d]->(target:Method)
+    WHERE ALL(node IN nodes(path) WHERE single(x IN nodes(path) WHERE x = node))
+    WITH path
+    ORDER BY length(path), [node IN nodes(path) | [node.parent_class_name, node.name]]
+    LIMIT $max_paths
+    WITH nodes(path) as call_path, length(path) as path_depth
+    UNWIND range(0, size(call_path)-1) as i
+    WITH call_path[i] as method_node, i as depth, path_depth
+    MATCH (method_node)<-[:HAS_METHOD]-(method_class:Class)
+    OPTIONAL MATCH (method_node)-[:METHOD_CALL]->(next_method:Method)<-[:HAS_METHOD]-(next_class:Class)
+    WHERE (depth < path_depth)
+    RETURN method_class.name as class_name, method_class.file_path as class_file,
+           method_node.name as method_name, method_node.visibility as method_visibility,
+           next_class.name as next_class, next_method.name as next_method,
+           depth
+}
+RETURN class_name, class_file, method_name, method_visibility,
+       next_class, next_method, depth
+ORDER BY depth, class_name, class_file, method_name, next_class, next_method
+SKIP $offset
+LIMIT $limit
+"""
+
+_METHOD_CALL_PATH_QUERY = """
+MATCH (from_class:Class {name: $from_class})-[:HAS_METHOD]->(from_method:Method {name: $from_method})
+MATCH (to_class:Class {name: $to_class})-[:HAS_METHOD]->(to_method:Method {name: $to_method})
+MATCH path = shortestPath((from_method)-[:METHOD_CALL*1..%d]->(to_method))
+WITH path LIMIT 1
+WITH nodes(path) as call_path
+UNWIND range(0, size(call_path)-1) as i
+WITH call_path[i] as method_node, i as step
+MATCH (method_node)<-[:HAS_METHOD]-(method_class:Class)
+RETURN method_class.name as class_name, method_class.file_path as class_file,
+       method_node.name as method_name, method_node.visibility as method_visibility,
+       step
+ORDER BY step
+"""
+
+# %d is the variable-length depth bound
+_REVERSE_CALL_STACK_QUERY = """
+MATCH (target_class:Class {name: $class_name})-[:HAS_METHOD]->(target_method:Method {name: $method_name})
+CALL {
+    WITH target_method
+    MATCH path = (caller:Method)-[:METHOD_CALL*1..%d]->(target_method)
+    WHERE ALL(node IN nodes(path) WHERE single(x IN nodes(path) WHERE x = node))
+    WITH nodes(path) as reverse_path
+    UNWIND range(0, size(reverse_path)-1) as i
+    WITH reverse_path[i] as method_node, i as depth
+    MATCH (method_node)<-[:HAS_METHOD]-(method_class:Class)
+    RETURN method_class.name as caller_class, method_class.file_path as caller_file,
+           method_node.name as caller_method, method_node.visibility as caller_visibility,
+           depth
+}
+RETURN caller_class, caller_file, caller_method, caller_visibility, depth
+ORDER BY depth, caller_class, caller_method
+"""
+
+# Older imports stored unresolved calls as self-loops, so they are excluded here.
+# Pages are keyed by (class name, method name, class file), compared column by
+# column since class names repeat across files. Counts use pattern comprehensions
+# rather than COUNT {} subqueries, which need Neo4j 5.3
+_CALL_STATISTICS_QUERY = """
+MATCH (c:Class)-[:HAS_METHOD]->(m:Method)
+WHERE $class_name IS NULL OR c.name = $class_name
+WITH c, m, coalesce(c.file_path, '') as class_file
+WHERE $after_class IS NULL
+   OR c.name > $after_class
+   OR (c.name = $after_class AND (m.name > $after_method
+       OR (m.name = $after_method AND class_file > $after_file)))
+WITH c, m, class_file
+ORDER BY c.name, m.name, class_file
+LIMIT $limit
+RETURN c.name as class_name,
+       m.name as method_name,
+       m.visibility as visibility,
+       class_file,
+       size([(m)-[:METHOD_CALL]->(callee:Method) WHERE callee <> m | callee]) as calls_made,
+       size([(caller:Method)-[:METHOD_CALL]->(m) WHERE caller <> m | caller]) as called_by
+ORDER BY class_name, method_name, class_file
+"""
+
+_CALL_SUMMARY_QUERY = """
+MATCH (c:Class)-[:HAS_METHOD]->(m:Method)
+WHERE $class_name IS NULL OR c.name = $class_name
+WITH m,
+     size([(m)-[:METHOD_CALL]->(callee:Method) WHERE callee <> m | callee]) as calls_made,
+     size([(caller:Method)-[:METHOD_CALL]->(m) WHERE caller <> m | caller]) > 0 as is_called
+RETURN count(m) as total_methods,
+       count(CASE WHEN calls_made > 0 THEN 1 END) as methods_with_calls,
+       count(CASE WHEN is_called THEN 1 END) as methods_called_by_others,
+       sum(calls_made) as total_call_relationships
+"""
+
+_METHODS_FOR_REVIEW_QUERY = """
+MATCH (c:Class)-[:HAS_METHOD]->(m:Method)
+WHERE m.definition IS NOT NULL AND m.definition <> ''
+RETURN elementId(m) as method_id,
+       m.name as method_name,
+       m.definition as method_definition,
+       m.visibility as method_visibility,
+       c.name as class_name,
+       c.file_path as file_path
+ORDER BY c.name, m.name, method_id
+SKIP $offset
+LIMIT $page_size
+"""
+
+_ADD_REVIEW_QUERY = """
+MATCH (m:Method) WHERE elementId(m) = $method_id
+CREATE (r:Review {
+    method_name: $method_name,
+    class_name: $class_name,
+    severity: $severity,
+    issue_type: $issue_type,
+    description: $description,
+    recommendation: $recommendation,
+    line_reference: $line_reference,
+    created_at: datetime()
+})
+CREATE (m)-[:HAS_REVIEW]->(r)
+RETURN elementId(r) as review_id
+"""
+
+_CLEAR_REVIEWS_QUERY = """
+MATCH (r:Review)
+CALL {
+    WITH r
+    DETACH DELETE r
+} IN TRANSACTIONS OF %d ROWS
+"""
+
+
+# Transaction functions for session.execute_read/execute_write: the driver retries them
+# on transient errors (deadlocks, leader switches), which auto-commit session.run doesn't.
+# Records are materialized inside the transaction since results close with it
+def _fetch_records(tx, query: str, parameters: Dict[str, Any]):
+    """Run a statement and return all of its records"""
+    return list(tx.run(query, parameters))
+
+
+def _fetch_single(tx, query: str, parameters: Dict[str, Any]):
+    """Run a statement and return its single record"""
+    return tx.run(query, parameters).single()
+
+
+@unit_of_work(timeout=TRAVERSAL_TIMEOUT)
+def _fetch_traversal(tx, query: str, parameters: Dict[str, Any]):
+    """Run a traversal statement under the traversal timeout and return all of its records"""
+    return list(tx.run(query, parameters))
+
+
+def _decode_statistics_cursor(cursor: str) -> Tuple[str, str, str]:
+    """Split a call statistics cursor into its (class, method, file) key, or Nones for the first page"""
+    if cursor is None:
+        return None, None, None
+    try:
+        key = json.loads(cursor)
+    except json.JSONDecodeError:
+        key = None
+    if not (isinstance(key, list) and len(key) == 3 and all(isinstance(part, str) for part in key)):
+        raise ValueError(f"Invalid call statistics cursor: {cursor!r}")
+    return tuple(key)
+
+
+def _parsing_columns(parsing_results: Dict[str, Dict[str, Any]]):
+    """Flatten parsing results into class, method and call columns for bulk import"""
+    classes = {column: [] for column in _CLASS_COLUMNS}
+    methods = {column: [] for column in _METHOD_COLUMNS}
+    calls = {column: [] for column in _CALL_COLUMNS}
+    
+    labels = _VISIBILITY_LABELS
+    
+    for language, language_results in parsing_results.items():
+        for file_path, file_result in language_results.items():
+            if 'error' in file_result:
+                continue
+            
+            # Normalize the file path to use OS-appropriate separators
+            normalized_path = os.path.normpath(file_path) if file_path else None
+            
+            for class_info in file_result.get('classes', []):
+                class_name = class_info['name']
+                classes["name"].append(class_name)
+                classes["file_path"].append(normalized_path)
+                class_visibility = class_info.get('visibility', 'private')
+                classes["visibility"].append(labels.get(class_visibility) or class_visibility.title())
+                
+                for method_info in class_info['methods']:
+                    method_name = method_info['name']
+                    method_calls_list = method_info.get('method_calls', [])
+                    methods["class_name"].append(class_name)
+                    methods["file_path"].append(normalized_path)
+                    methods["name"].append(method_name)
+                    method_visibility = method_info.get('visibility', 'private')
+                    methods["visibility"].append(labels.get(method_visibility) or method_visibility.title())
+                    methods["method_calls"].append(method_calls_list)
+                    methods["definition"].append(method_info.get('definition'))
+                    methods["content_hash"].append(_method_hash(methods, -1))
+                    
+                    calls["class_name"].extend([class_name] * len(method_calls_list))
+                    calls["method_name"].extend([method_name] * len(method_calls_list))
+                    calls["called_method_name"].extend(method_calls_list)
+    
+    _combine_shared_hashes(methods)
+    return classes, methods, calls
+
+
+def _method_hash(methods: Dict[str, List], row: int) -> str:
+    """Hash every stored property of one method row so unchanged methods can be skipped on re-import"""
+    content = tuple(methods[column][row] for column in _METHOD_COLUMNS if column != "content_hash")
+    return hashlib.sha256(repr(content).encode()).hexdigest()
+
+
+def _combine_shared_hashes(methods: Dict[str, List]):
+    """Give every method row sharing a (class, name) key the hash of all of those rows together
+    
+    Overloads MERGE into one Method node, so skipping them one row at a time against its
+    single stored hash would keep rewriting whichever overload didn't win last time.
+    """
+    rows_by_key = defaultdict(list)
+    for row, key in enumerate(zip(methods["class_name"], methods["name"])):
+        rows_by_key[key].append(row)
+    
+    hashes = methods["content_hash"]
+    for rows in rows_by_key.values():
+        if len(rows) > 1:
+            combined = hashlib.sha256(''.join(hashes[row] for row in rows).encode()).hexdigest()
+            for row in rows:
+                hashes[row] = combined
+
+
+def _drop_rows(columns: Dict[str, List], keep: List[bool]) -> Dict[str, List]:
+    """Keep only the rows of parallel columns whose keep flag is set"""
+    return {column: [value for value, kept in zip(values, keep) if kept] for column, values in columns.items()}
+
+
+def _intern_columns(columns: Dict[str, List]) -> Dict[str, List]:
+    """Replace name columns with indexes into a shared `names` list of their distinct values"""
+    table = {}
+    encoded = {}
+    for column, values in columns.items():
+        if column in _INTERNED_COLUMNS:
+            encoded[column] = [table.setdefault(value, len(table)) for value in values]
+        else:
+            encoded[column] = values
+    encoded["names"] = list(table)
+    return encoded
+
+
+def _column_batches(columns: Dict[str, List], batch_size: int):
+    """Yield interned slices of parallel columns holding at most batch_size rows each"""
+    total = len(next(iter(columns.values())))
+    for start in range(0, total, batch_size):
+        yield _intern_columns({column: values[start:start + batch_size] for column, values in columns.items()})
+
+
+def _build_call_stack(rows: Iterator[Tuple[str, str, str, str, str, str]]) -> Dict[str, Any]:
+    """Materialize streamed call stack rows into the nested class -> methods -> calls dict"""
+    call_stack = defaultdict(lambda: {"file_path": None, "methods": defaultdict(lambda: {"visibility": None, "calls": {}})})
+    
+    for class_name, class_file, method_name, method_visibility, target_class_name, target_method_name in rows:
+        class_entry = call_stack[class_name]
+        class_entry["file_path"] = class_file
+        method_entry = class_entry["methods"][method_name]
+        method_entry["visibility"] = method_visibility
+        
+        # Add target method if it exists
+        if target_class_name and target_method_name:
+            method_entry["calls"][f"{target_class_name}.{target_method_name}"] = {
+                "class": target_class_name,
+                "method": target_method_name
+            }
+    
+    # Return plain dicts so lookups on a (possibly cached) result can't insert empty entries
+    for class_entry in call_stack.values():
+        class_entry["methods"] = dict(class_entry["methods"])
+    return dict(call_stack)
+
+
+class BulkNeo4jLoader:
+    """Loads parsing-result columns through apoc.periodic.iterate instead of client-side transactions"""
+    
+    def __init__(self, driver, batch_size: int = 10000, database: str = "neo4j", retries: int = 3):
+        self.driver = driver
+        self.batch_size = batch_size
+        self.database = database
+        self.retries = retries
+    
+    def load(self, classes: Dict[str, List], methods: Dict[str, List], calls: Dict[str, List]):
+        """Run the import statements server-side; raises ClientError if APOC is not installed"""
+        with self.driver.session(database=self.database) as session:
+            for (prefix, action, parallel), columns in zip(_IMPORT_STEPS, (classes, methods, calls)):
+                if not next(iter(columns.values())):
+                    continue
+                
+                record = session.run(
+                    _APOC_ITERATE,
+                    iterate=prefix + " RETURN r",
+                    action=action,
+                    batch_size=self.batch_size,
+                    parallel=parallel,
+                    retries=self.retries,
+                    columns=_intern_columns(columns)
+                ).single()
+                
+                if record["failedBatches"]:
+                    raise RuntimeError(f"Bulk import failed: {record['errorMessages']}")
+
 
 class Neo4jGraphDB(GraphDatabaseInterface):
     """Neo4j implementation for storing static call stack graph"""
     
-    def __init__(self, uri: str = "bolt://localhost:7687", username: str = "neo4j", password: str = "password", clear_db: bool = True):
+    def __init__(self, uri: str = "bolt://localhost:7687", username: str = "neo4j", password: str = "password", clear_db: bool = True,
+                 max_connection_pool_size: int = 100, connection_acquisition_timeout: float = 60.0,
+                 max_connection_lifetime: float = 3600.0, max_transaction_retry_time: float = 30.0,
+                 batch_size: int = 10000, create_indexes: bool = True, max_workers: int = min(8, os.cpu_count() or 1),
+                 database: str = "neo4j", fetch_size: int = 10000):
         """
         Initialize Neo4j connection
         
@@ -19,17 +571,45 @@ class Neo4jGraphDB(GraphDatabaseInterface):
             username: Database username
             password: Database password
             clear_db: Whether to clear existing data on initialization (default: True)
+            max_connection_pool_size: Maximum number of pooled connections
+            connection_acquisition_timeout: Seconds to wait for a free pooled connection
+            max_connection_lifetime: Seconds after which a pooled connection is recycled
+            max_transaction_retry_time: Seconds a transaction function keeps retrying transient errors
+            batch_size: Rows per UNWIND transaction when storing parsing results
+            create_indexes: Whether to create lookup indexes before any data is stored
+            max_workers: Concurrent write transactions when storing independent batches
+            database: Database every session runs against (skips home-database resolution)
+            fetch_size: Records pulled per round-trip when reading results
         """
         self.uri = uri
         self.username = username
         self.password = password
         self.clear_db = clear_db
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.batch_size = batch_size
+        self.create_indexes = create_indexes
+        self.max_workers = max_workers
+        self.database = database
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(username, password),
+            max_connection_pool_size=max_connection_pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+            max_connection_lifetime=max_connection_lifetime,
+            max_transaction_retry_time=max_transaction_retry_time,
+            # Large reads (print_graph, review pages) are materialized anyway, so pull them
+            # in fewer, bigger batches than the driver's default of 1000 records
+            fetch_size=fetch_size,
+            keep_alive=True
+        )
         self.initialize()
     
+    def _session(self, **config):
+        """Open a session on the configured database"""
+        return self.driver.session(database=self.database, **config)
+    
     def initialize(self):
         """Initialize the Neo4j database schema"""
-        with self.driver.session() as session:
+        with self._session() as session:
             # Clear existing data only if requested
             if self.clear_db:
                 session.run("MATCH (n) DETACH DELETE n")
@@ -46,289 +626,229 @@ class Neo4jGraphDB(GraphDatabaseInterface):
                 session.run("CREATE CONSTRAINT method_unique IF NOT EXISTS FOR (m:Method) REQUIRE (m.name, m.parent_class_name) IS UNIQUE")
             except:
                 pass  # Constraint might already exist
+            
+            if not self.create_indexes:
+                return
+            
+            # Single-property indexes for the MATCH (c:Class {name: ...}) / (m:Method {name: ...})
+            # lookups used by the API and by call resolution during bulk import; the composite
+            # constraint indexes don't serve them
+            for index_name, label, prop in [("class_name", "Class", "name"), ("method_name", "Method", "name")]:
+                try:
+                    result = session.run(f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})")
+                    if result.consume().counters.indexes_added:
+                        print(f"📇 Created index {index_name} on :{label}({prop})")
+                except Exception:
+                    pass  # Index might already exist under another name
     
     def add_class(self, class_name: str, file_path: str, visibility: str = "Private") -> str:
         """Add a class node to the graph"""
-        query = """
-        MERGE (c:Class {name: $name, file_path: $file_path})
-        ON CREATE SET 
-            c.visibility = $visibility,
-            c.type = 'Class'
-        ON MATCH SET
-            c.visibility = $visibility,
-            c.file_path = $file_path,
-            c.type = 'Class'
-        RETURN elementId(c) as class_id
-        """
-        
         # Normalize the file path to use OS-appropriate separators
         normalized_path = os.path.normpath(file_path) if file_path else None
         
-        with self.driver.session() as session:
-            result = session.run(query, name=class_name, file_path=normalized_path, visibility=visibility)
-            return result.single()["class_id"]
+        # Always MERGE: a remembered element id goes stale as soon as another process or
+        # instance clears or rewrites the graph
+        with self._session() as session:
+            record = session.execute_write(_fetch_single, _ADD_CLASS_QUERY, {"name": class_name, "file_path": normalized_path, "visibility": visibility})
+        return record["class_id"]
     
     def add_method(self, method_name: str, visibility: str, parent_class_id: str, method_calls: List[str] = None, definition: str = None) -> str:
-        """Add a method node to the graph under a class"""
+        """Add a method node to the graph under a class and link its method calls in the same query"""
         if method_calls is None:
             method_calls = []
             
-        query = """
-        MATCH (c:Class) WHERE elementId(c) = $parent_class_id
-        MERGE (m:Method {name: $name, parent_class_name: c.name})
-        ON CREATE SET 
-            m.visibility = $visibility,
-            m.type = 'Method',
-            m.method_calls = $method_calls,
-            m.definition = $definition
-        ON MATCH SET
-            m.visibility = $visibility,
-            m.type = 'Method',
-            m.method_calls = $method_calls,
-            m.definition = $definition
-        MERGE (c)-[:HAS_METHOD]->(m)
-        RETURN elementId(m) as method_id
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, name=method_name, visibility=visibility, parent_class_id=parent_class_id, method_calls=method_calls, definition=definition)
-            return result.single()["method_id"]
+        with self._session() as session:
+            record = session.execute_write(_fetch_single, _ADD_METHOD_QUERY, {"name": method_name, "visibility": visibility, "parent_class_id": parent_class_id, "method_calls": method_calls, "definition": definition})
+        if record is None:
+            raise ValueError(f"Parent class {parent_class_id} no longer exists; add the class again")
+        return record["method_id"]
     
     def add_method_call(self, method_id: str, called_method_name: str):
-        """Add a method call relationship - try to find actual target method, fallback to property-based"""
-        query = """
-        MATCH (m:Method) WHERE elementId(m) = $method_id
-        OPTIONAL MATCH (target:Method {name: $called_method_name})
-        WHERE target <> m
-        FOREACH (t IN CASE WHEN target IS NOT NULL THEN [target] ELSE [] END |
-            MERGE (m)-[:METHOD_CALL {type: "SIMPLE_CALL"}]->(t)
-        )
-        FOREACH (_ IN CASE WHEN target IS NULL THEN [1] ELSE [] END |
-            MERGE (m)-[:METHOD_CALL {method_name: $called_method_name, type: "UNRESOLVED_CALL"}]->(m)
-        )
-        """
-        
-        with self.driver.session() as session:
-            session.run(query, method_id=method_id, called_method_name=called_method_name)
+        """Add a method call - record the name on the method and link it to matching target methods"""
+        with self._session() as session:
+            session.execute_write(_fetch_records, _ADD_CALLS_QUERY, {
+                "rows": [{"method_id": method_id, "called_method_name": called_method_name}]
+            })
+    
+    def add_method_calls(self, calls: List[Tuple[str, str]]):
+        """Add many (method_id, called_method_name) call relationships in batched write transactions"""
+        rows = [{"method_id": method_id, "called_method_name": name} for method_id, name in calls]
+        with self._session() as session:
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start:start + self.batch_size]
+                session.execute_write(lambda tx: tx.run(_ADD_CALLS_QUERY, rows=batch).consume())
     
     def create_method_call_relationship(self, calling_class: str, calling_method: str, 
                                       target_class: str, target_method: str, call_type: str = "METHOD_CALL"):
         """Create a relationship between methods in different classes"""
-        query = """
-        MATCH (calling_class:Class {name: $calling_class})
-        MATCH (target_class:Class {name: $target_class})
-        MATCH (calling_class)-[:HAS_METHOD]->(calling_method:Method {name: $calling_method})
-        MATCH (target_class)-[:HAS_METHOD]->(target_method:Method {name: $target_method})
-        MERGE (calling_method)-[:METHOD_CALL {type: $call_type}]->(target_method)
-        """
+        self.create_method_call_relationships([{
+            "calling_class": calling_class,
+            "calling_method": calling_method,
+            "target_class": target_class,
+            "target_method": target_method,
+            "call_type": call_type
+        }])
+    
+    def create_method_call_relationships(self, relationships: List[Dict[str, str]]):
+        """Create many cross-class method call relationships in batched write transactions
         
-        with self.driver.session() as session:
-            session.run(query, 
-                       calling_class=calling_class, 
-                       calling_method=calling_method,
-                       target_class=target_class, 
-                       target_method=target_method,
-                       call_type=call_type)
+        Each item holds calling_class, calling_method, target_class, target_method and
+        optionally call_type (default "METHOD_CALL").
+        """
+        with self._session() as session:
+            for start in range(0, len(relationships), self.batch_size):
+                batch = relationships[start:start + self.batch_size]
+                session.execute_write(_fetch_records, _CREATE_CALL_RELATIONSHIPS_QUERY, {"rows": batch})
 
+    def iter_call_stack(self, class_name: str) -> Iterator[Tuple[str, str, str, str, str, str]]:
+        """Stream (class_name, class_file, method_name, method_visibility, target_class_name,
+        target_method_name) rows for a class as the server returns them"""
+        yield from self._stream_records(_CALL_STACK_QUERY, {"class_name": class_name})
+    
+    def iter_method_call_stack(self, class_name: str, method_name: str) -> Iterator[Tuple[str, str, str, str, str, str]]:
+        """Stream call stack rows (same shape as iter_call_stack) for the classes a method calls into"""
+        yield from self._stream_records(_METHOD_CALL_STACK_QUERY, {"class_name": class_name, "method_name": method_name})
+    
+    def _stream_records(self, query: str, parameters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Yield records one at a time from an explicit read transaction
+        
+        A managed execute_read transaction function can't hand records out lazily (its result
+        is consumed when the function returns), so the transaction is held open until the
+        caller finishes iterating and records arrive in fetch_size batches.
+        """
+        with self._session(default_access_mode=READ_ACCESS) as session:
+            with session.begin_transaction() as tx:
+                for record in tx.run(query, parameters):
+                    yield tuple(record)
+    
     def get_call_stack(self, class_name: str) -> Dict[str, Any]:
         """Get the complete call stack for a specific class"""
-        query = """
-        MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
-        OPTIONAL MATCH (m)-[:METHOD_CALL]->(target_method:Method)<-[:HAS_METHOD]-(target_class:Class)
-        RETURN c.name as class_name, c.file_path as class_file,
-               m.name as method_name, m.visibility as method_visibility,
-               target_class.name as target_class_name, 
-               target_method.name as target_method_name
-        ORDER BY method_name, target_class_name, target_method_name
-        """
-        
-        call_stack = {}
-        
-        with self.driver.session() as session:
-            result = session.run(query, class_name=class_name)
-            
-            for record in result:
-                class_name = record["class_name"]
-                method_name = record["method_name"]
-                method_visibility = record["method_visibility"]
-                target_class_name = record["target_class_name"]
-                target_method_name = record["target_method_name"]
-                
-                # Initialize class structure
-                if class_name not in call_stack:
-                    call_stack[class_name] = {
-                        "file_path": record["class_file"],
-                        "methods": {}
-                    }
-                
-                # Initialize method structure
-                if method_name not in call_stack[class_name]["methods"]:
-                    call_stack[class_name]["methods"][method_name] = {
-                        "visibility": method_visibility,
-                        "calls": {}
-                    }
-                
-                # Add target method if it exists
-                if target_class_name and target_method_name:
-                    target_key = f"{target_class_name}.{target_method_name}"
-                    call_stack[class_name]["methods"][method_name]["calls"][target_key] = {
-                        "class": target_class_name,
-                        "method": target_method_name
-                    }
-        
-        return call_stack
+        return _build_call_stack(self.iter_call_stack(class_name))
 
     def get_method_call_stack(self, class_name: str, method_name: str) -> Dict[str, Any]:
         """Get the call stack for a specific method in a class"""
-        query = """
-        MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method {name: $method_name})
-        OPTIONAL MATCH (m)-[:METHOD_CALL]->(target_method:Method)<-[:HAS_METHOD]-(target_class:Class)
-        WITH target_class, target_method
-        WHERE target_class IS NOT NULL AND target_method IS NOT NULL
-        MATCH (target_class)-[:HAS_METHOD]->(all_methods:Method)
-        OPTIONAL MATCH (all_methods)-[:METHOD_CALL]->(nested_method:Method)<-[:HAS_METHOD]-(nested_class:Class)
-        RETURN target_class.name as class_name, target_class.file_path as class_file,
-               all_methods.name as method_name, all_methods.visibility as method_visibility,
-               nested_class.name as target_class_name, 
-               nested_method.name as target_method_name
-        ORDER BY class_name, method_name, target_class_name, target_method_name
+        return _build_call_stack(self.iter_method_call_stack(class_name, method_name))
+
+    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]], bulk: bool = False):
+        """Store the parsing results in the graph database using batched writes"""
+        classes, methods, calls = _parsing_columns(parsing_results)
+        if not self.clear_db:
+            methods = self._changed_methods(methods)
+        
+        if bulk:
+            try:
+                BulkNeo4jLoader(self.driver, self.batch_size, self.database).load(classes, methods, calls)
+                return
+            except ClientError as e:
+                if "ProcedureNotFound" not in (e.code or ""):
+                    raise
+                print("⚠️  APOC not available, falling back to batched UNWIND import")
+        
+        # Classes first, then methods, then calls so every call can resolve against the full method set
+        for (query, parallel), columns in zip(_IMPORT_QUERIES, (classes, methods, calls)):
+            self._write_batches(query, columns, parallel)
+    
+    def _changed_methods(self, methods: Dict[str, List]) -> Dict[str, List]:
+        """Drop method rows whose content hash matches what an earlier import already stored
+        
+        Rows of overloads share one combined hash, so they are kept or dropped together.
+        Call rows are always written: a new method elsewhere can resolve calls made by an
+        unchanged one, and MERGE leaves existing call relationships alone.
         """
+        with self._session() as session:
+            stored = {tuple(record) for record in session.execute_read(_fetch_records, _STORED_METHOD_HASHES, {})}
         
-        call_stack = {}
+        keep = [
+            (class_name, name, content_hash) not in stored
+            for class_name, name, content_hash in zip(methods["class_name"], methods["name"], methods["content_hash"])
+        ]
+        skipped = keep.count(False)
+        if skipped:
+            print(f"⏭️  Skipping {skipped} unchanged methods")
+        return _drop_rows(methods, keep)
+    
+    def _write_batches(self, query: str, columns: Dict[str, List], parallel: bool):
+        """Write column batches in their own transactions, concurrently over the pool when parallel"""
+        def write(batch):
+            # Sessions are not thread-safe, so each batch gets its own
+            with self._session() as session:
+                session.execute_write(lambda tx: tx.run(query, batch).consume())
         
-        with self.driver.session() as session:
-            result = session.run(query, class_name=class_name, method_name=method_name)
-            
-            for record in result:
-                class_name = record["class_name"]
-                method_name = record["method_name"]
-                method_visibility = record["method_visibility"]
-                target_class_name = record["target_class_name"]
-                target_method_name = record["target_method_name"]
-                
-                # Initialize class structure
-                if class_name not in call_stack:
-                    call_stack[class_name] = {
-                        "file_path": record["class_file"],
-                        "methods": {}
-                    }
-                
-                # Initialize method structure
-                if method_name not in call_stack[class_name]["methods"]:
-                    call_stack[class_name]["methods"][method_name] = {
-                        "visibility": method_visibility,
-                        "calls": {}
-                    }
-                
-                # Add target method if it exists
-                if target_class_name and target_method_name:
-                    target_key = f"{target_class_name}.{target_method_name}"
-                    call_stack[class_name]["methods"][method_name]["calls"][target_key] = {
-                        "class": target_class_name,
-                        "method": target_method_name
-                    }
+        batches = _column_batches(columns, self.batch_size)
+        if parallel and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Consume the results so a failed batch raises here
+                list(executor.map(write, batches))
+        else:
+            for batch in batches:
+                write(batch)
+    
+    async def store_parsing_results_async(self, parsing_results: Dict[str, Dict[str, Any]]):
+        """Store the parsing results with the async driver, overlapping independent batch commits"""
+        classes, methods, calls = _parsing_columns(parsing_results)
+        if not self.clear_db:
+            methods = await asyncio.to_thread(self._changed_methods, methods)
         
-        return call_stack
-
-    def store_parsing_results(self, parsing_results: Dict[str, Dict[str, Any]]):
-        """Store the parsing results in the graph database"""
-        for language, language_results in parsing_results.items():
-            for file_path, file_result in language_results.items():
-                if 'error' in file_result:
-                    continue
-                
-                if 'classes' in file_result:
-                    for class_info in file_result['classes']:
-                        # Add class to database
-                        class_visibility = class_info.get('visibility', 'private').title()
-                        class_id = self.add_class(
-                            class_name=class_info['name'],
-                            file_path=file_path,
-                            visibility=class_visibility
-                        )
-                        
-                        # Add methods under the class
-                        for method_info in class_info['methods']:
-                            # Extract method calls list
-                            method_calls_list = method_info.get('method_calls', [])
-                            
-                            method_id = self.add_method(
-                                method_name=method_info['name'],
-                                visibility=method_info.get('visibility', 'private').title(),
-                                parent_class_id=class_id,
-                                method_calls=method_calls_list,
-                                definition=method_info.get('definition')
-                            )
-                            
-                            # Add method calls as relationships if they exist
-                            if 'method_calls' in method_info:
-                                for called_method in method_info['method_calls']:
-                                    self.add_method_call(method_id, called_method)
+        # Async drivers are bound to the running event loop, so one is opened per call
+        async with AsyncGraphDatabase.driver(self.uri, auth=(self.username, self.password)) as driver:
+            semaphore = asyncio.Semaphore(max(1, self.max_workers))
+            
+            async def write(query, batch):
+                async with semaphore:
+                    async with driver.session(database=self.database) as session:
+                        await session.execute_write(lambda tx: self._run_async(tx, query, batch))
+            
+            # Steps stay in dependency order; only batches within a parallel-safe step overlap
+            for (query, parallel), columns in zip(_IMPORT_QUERIES, (classes, methods, calls)):
+                batches = _column_batches(columns, self.batch_size)
+                if parallel:
+                    await asyncio.gather(*(write(query, batch) for batch in batches))
+                else:
+                    for batch in batches:
+                        await write(query, batch)
+    
+    @staticmethod
+    async def _run_async(tx, query: str, parameters: Dict[str, Any]):
+        """Run one statement in an async transaction and wait for it to complete"""
+        result = await tx.run(query, parameters)
+        await result.consume()
     
     def print_graph(self):
         """Print the graph in the specified format"""
-        # First get all classes
-        class_query = """
-        MATCH (c:Class)
-        RETURN c.name as class_name, 
-               c.file_path as file_path, 
-               c.visibility as class_visibility
-        ORDER BY c.name
-        """
+        with self._session() as session:
+            class_results = session.execute_read(_fetch_records, _PRINT_GRAPH_QUERY, {})
         
-        with self.driver.session() as session:
-            class_results = session.run(class_query)
+        # Build the whole listing and write it once; a print() per line dominates on large graphs
+        lines = []
+        for class_record in class_results:
+            class_name = class_record["class_name"]
+            file_path = class_record["file_path"]
+            class_visibility = class_record["class_visibility"]
             
-            for class_record in class_results:
-                class_name = class_record["class_name"]
-                file_path = class_record["file_path"]
-                class_visibility = class_record["class_visibility"]
-                
-                # Print class with properties
-                print(f"{class_name} (Properties - Type:Class,FilePath:{file_path},Visibility:{class_visibility})")
-                
-                # Get methods for this class
-                method_query = """
-                MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
-                RETURN m.name as method_name, 
-                       m.visibility as method_visibility
-                ORDER BY m.name
-                """
-                
-                method_results = session.run(method_query, class_name=class_name)
+            # Class line with properties
+            lines.append(f"{class_name} (Properties - Type:Class,FilePath:{file_path},Visibility:{class_visibility})")
+            
+            for method in class_record["methods"]:
+                method_name = method["name"]
+                method_visibility = method["visibility"]
+                method_calls = sorted(method["calls"])
                 
-                for method_record in method_results:
-                    method_name = method_record["method_name"]
-                    method_visibility = method_record["method_visibility"]
-                    
-                    # Get method calls for this method
-                    calls_query = """
-                    MATCH (m:Method {name: $method_name, parent_class_name: $class_name})
-                    OPTIONAL MATCH (m)-[call:METHOD_CALL]->(target:Method)
-                    OPTIONAL MATCH (target)<-[:HAS_METHOD]-(target_class:Class)
-                    RETURN CASE 
-                        WHEN target_class IS NOT NULL THEN target_class.name + '.' + target.name
-                        ELSE call.method_name 
-                    END as called_method
-                    ORDER BY called_method
-                    """
-                    
-                    calls_results = session.run(calls_query, method_name=method_name, class_name=class_name)
-                    method_calls = [record["called_method"] for record in calls_results if record["called_method"]]
-                    
-                    # Format method calls as part of properties, limit length for readability
-                    if method_calls:
-                        calls_str = ','.join(method_calls)
-                        # Truncate if too long to avoid display issues
-                        if len(calls_str) > 50:
-                            calls_str = calls_str[:47] + "..."
-                        calls_property = f",Calls:[{calls_str}]"
-                    else:
-                        calls_property = ",Calls:[]"
-                    
-                    print(f"                   |____> {method_name}  (Properties - Type:Method,Visibility:{method_visibility}{calls_property})")
+                # Format method calls as part of properties, limit length for readability
+                if method_calls:
+                    calls_str = ','.join(method_calls)
+                    # Truncate if too long to avoid display issues
+                    if len(calls_str) > 50:
+                        calls_str = calls_str[:47] + "..."
+                    calls_property = f",Calls:[{calls_str}]"
+                else:
+                    calls_property = ",Calls:[]"
                 
-                print()  # Empty line between classes
+                lines.append(f"                   |____> {method_name}  (Properties - Type:Method,Visibility:{method_visibility}{calls_property})")
+            
+            lines.append("")  # Empty line between classes
+        
+        if lines:
+            print("\n".join(lines))
     
     def close(self):
         """Clean up database connection"""
@@ -337,125 +857,67 @@ class Neo4jGraphDB(GraphDatabaseInterface):
     
     def get_recursive_call_stack(self, class_name: str, max_depth: int = 10) -> Dict[str, Any]:
         """Get complete call stack with configurable depth (all outgoing calls from class methods)"""
+        max_depth = max(1, min(int(max_depth), MAX_TRAVERSAL_DEPTH))
         call_stack = {}
         
-        with self.driver.session() as session:
-            # First, get basic class and method information
-            base_query = """
-            MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method)
-            RETURN c.name as class_name, c.file_path as file_path,
-                   m.name as method_name, m.visibility as method_visibility
-            ORDER BY method_name
-            """
-            
-            base_result = session.run(base_query, class_name=class_name)
+        # Methods and their call chains come back together, one row per method
+        with self._session() as session:
+            result = session.execute_read(_fetch_traversal, _RECURSIVE_CALL_STACK_QUERY % max_depth, {"class_name": class_name})
+        
+        # Records unpack positionally in RETURN order, skipping a key lookup per field
+        for cls_name, file_path, method_name, method_visibility, calls in result:
+            class_entry = call_stack.setdefault(cls_name, {"file_path": file_path, "methods": {}})
+            method_entry = class_entry["methods"].setdefault(method_name, {
+                "visibility": method_visibility,
+                "recursive_calls": {},
+                "max_depth_reached": max_depth
+            })
             
-            for record in base_result:
-                cls_name = record["class_name"]
-                file_path = record["file_path"]
-                method_name = record["method_name"]
-                method_visibility = record["method_visibility"]
+            recursive_calls = method_entry["recursive_calls"]
+            for call in calls:
+                depth = call["depth"]
+                called_class = call["called_class"]
+                called_method = call["called_method"]
                 
-                # Initialize class structure
-                if cls_name not in call_stack:
-                    call_stack[cls_name] = {
-                        "file_path": file_path,
-                        "methods": {}
-                    }
+                call_key = f"depth_{depth}_{called_class}.{called_method}"
                 
-                # Initialize method structure
-                if method_name not in call_stack[cls_name]["methods"]:
-                    call_stack[cls_name]["methods"][method_name] = {
-                        "visibility": method_visibility,
-                        "recursive_calls": {},
-                        "max_depth_reached": max_depth
-                    }
-            
-            # If no methods found, return the empty structure
-            if not call_stack:
-                return {}
-            
-            # Now get the call chains for each method
-            calls_query = """
-            MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(m:Method {name: $method_name})
-            MATCH path = (m)-[:METHOD_CALL*1..$max_depth]->(target:Method)
-            WITH nodes(path) as call_chain
-            UNWIND range(0, size(call_chain)-1) as i
-            WITH call_chain[i] as method_at_depth, i as depth
-            MATCH (method_at_depth)<-[:HAS_METHOD]-(method_class:Class)
-            RETURN method_at_depth.name as called_method,
-                   method_class.name as called_class,
-                   depth
-            ORDER BY depth, called_class, called_method
-            """
-            
-            # Get calls for each method
-            for cls_name in call_stack:
-                for method_name in call_stack[cls_name]["methods"]:
-                    calls_result = session.run(calls_query, 
-                                             class_name=class_name, 
-                                             method_name=method_name, 
-                                             max_depth=max_depth)
-                    
-                    for call_record in calls_result:
-                        depth = call_record["depth"]
-                        called_class = call_record["called_class"]
-                        called_method = call_record["called_method"]
-                        
-                        call_key = f"depth_{depth}_{called_class}.{called_method}"
-                        
-                        call_stack[cls_name]["methods"][method_name]["recursive_calls"][call_key] = {
-                            "caller_class": class_name,
-                            "caller_method": method_name,
-                            "callee_class": called_class,
-                            "callee_method": called_method,
-                            "depth": depth
-                        }
-        
-        return call_stack
+                recursive_calls[call_key] = {
+                    "caller_class": class_name,
+                    "caller_method": method_name,
+                    "callee_class": called_class,
+                    "callee_method": called_method,
+                    "depth": depth
+                }
         
         return call_stack
 
-    def get_method_call_tree(self, class_name: str, method_name: str, max_depth: int = 5) -> Dict[str, Any]:
-        """Get hierarchical call tree for a specific method with cycle detection"""
-        query = """
-        MATCH (c:Class {name: $class_name})-[:HAS_METHOD]->(root:Method {name: $method_name})
-        CALL {
-            WITH root
-            MATCH path = (root)-[:METHOD_CALL*0..$max_depth]->(target:Method)
-            WHERE ALL(node IN nodes(path) WHERE single(x IN nodes(path) WHERE x = node))
-            WITH nodes(path) as call_path, length(path) as path_depth
-            UNWIND range(0, size(call_path)-1) as i
-            WITH call_path[i] as method_node, i as depth, path_depth
-            MATCH (method_node)<-[:HAS_METHOD]-(method_class:Class)
-            OPTIONAL MATCH (method_node)-[:METHOD_CALL]->(next_method:Method)<-[:HAS_METHOD]-(next_class:Class)
-            WHERE (depth < path_depth)
-            RETURN method_class.name as class_name, method_class.file_path as class_file,
-                   method_node.name as method_name, method_node.visibility as method_visibility,
-                   next_class.name as next_class, next_method.name as next_method,
-                   depth
-        }
-        RETURN class_name, class_file, method_name, method_visibility,
-               next_class, next_method, depth
-        ORDER BY depth, class_name, method_name
+    def get_method_call_tree(self, class_name: str, method_name: str, max_depth: int = 5,
+                             limit: int = 5000, offset: int = 0) -> Dict[str, Any]:
+        """Get hierarchical call tree for a specific method with cycle detection
+        
+        At most `limit` tree rows are returned starting at `offset`; when the page
+        is full, "next_cursor" holds the offset of the next page.
         """
+        max_depth = max(1, min(int(max_depth), MAX_TRAVERSAL_DEPTH))
+        # Variable-length bounds cannot be parameters, so the (int-validated, clamped) depth is inlined
+        query = _METHOD_CALL_TREE_QUERY % max_depth
         
         call_tree = {
             "root": {"class": class_name, "method": method_name},
             "tree": {},
-            "max_depth": max_depth
+            "max_depth": max_depth,
+            "next_cursor": None
         }
+        row_count = 0
         
-        with self.driver.session() as session:
-            result = session.run(query, class_name=class_name, method_name=method_name, max_depth=max_depth)
+        with self._session() as session:
+            result = session.execute_read(_fetch_traversal, query, {
+                "class_name": class_name, "method_name": method_name, "max_paths": MAX_TREE_PATHS,
+                "offset": offset, "limit": limit
+            })
             
-            for record in result:
-                depth = record["depth"]
-                current_class = record["class_name"]
-                current_method = record["method_name"]
-                current_visibility = record["method_visibility"]
-                next_class = record["next_class"]
-                next_method = record["next_method"]
+            for current_class, class_file, current_method, current_visibility, next_class, next_method, depth in result:
+                row_count += 1
                 
                 # Build tree structure
                 depth_key = f"depth_{depth}"
@@ -466,7 +928,7 @@ class Neo4jGraphDB(GraphDatabaseInterface):
                     "class": current_class,
                     "method": current_method,
                     "visibility": current_visibility,
-                    "file_path": record["class_file"],
+                    "file_path": class_file,
                     "calls": []
                 }
                 
@@ -478,184 +940,160 @@ class Neo4jGraphDB(GraphDatabaseInterface):
                 
                 call_tree["tree"][depth_key].append(node_info)
         
+        if row_count == limit:
+            call_tree["next_cursor"] = str(offset + limit)
+        
         return call_tree
 
-    def get_method_call_path(self, from_class: str, from_method: str, to_class: str, to_method: str, max_depth: int = 10) -> List[Dict]:
-        """Find all paths between two specific methods"""
-        query = """
-        MATCH (from_class:Class {name: $from_class})-[:HAS_METHOD]->(from_method:Method {name: $from_method})
-        MATCH (to_class:Class {name: $to_class})-[:HAS_METHOD]->(to_method:Method {name: $to_method})
-        MATCH path = shortestPath((from_method)-[:METHOD_CALL*1..$max_depth]->(to_method))
-        WITH nodes(path) as call_path
-        UNWIND range(0, size(call_path)-1) as i
-        WITH call_path[i] as method_node, i as step
-        MATCH (method_node)<-[:HAS_METHOD]-(method_class:Class)
-        RETURN method_class.name as class_name, method_class.file_path as class_file,
-               method_node.name as method_name, method_node.visibility as method_visibility,
-               step
-        ORDER BY step
-        """
+    def get_method_call_path(self, from_class: str, from_method: str, to_class: str, to_method: str, max_depth: int = 8) -> List[Dict]:
+        """Find the shortest call path between two specific methods"""
+        max_depth = max(1, min(int(max_depth), MAX_TRAVERSAL_DEPTH))
+        query = _METHOD_CALL_PATH_QUERY % max_depth
         
         paths = []
         
-        with self.driver.session() as session:
-            result = session.run(query, 
-                               from_class=from_class, from_method=from_method,
-                               to_class=to_class, to_method=to_method,
-                               max_depth=max_depth)
+        with self._session() as session:
+            result = session.execute_read(_fetch_traversal, query, {
+                "from_class": from_class, "from_method": from_method,
+                "to_class": to_class, "to_method": to_method
+            })
             
-            for record in result:
+            for path_class, class_file, path_method, method_visibility, step in result:
                 paths.append({
-                    "step": record["step"],
-                    "class": record["class_name"],
-                    "method": record["method_name"],
-                    "visibility": record["method_visibility"],
-                    "file_path": record["class_file"]
+                    "step": step,
+                    "class": path_class,
+                    "method": path_method,
+                    "visibility": method_visibility,
+                    "file_path": class_file
                 })
         
         return paths
 
     def get_reverse_call_stack(self, class_name: str, method_name: str, max_depth: int = 5) -> Dict[str, Any]:
         """Find what methods call into this method (reverse lookup)"""
-        query = """
-        MATCH (target_class:Class {name: $class_name})-[:HAS_METHOD]->(target_method:Method {name: $method_name})
-        CALL {
-            WITH target_method
-            MATCH path = (caller:Method)-[:METHOD_CALL*1..$max_depth]->(target_method)
-            WHERE ALL(node IN nodes(path) WHERE single(x IN nodes(path) WHERE x = node))
-            WITH nodes(path) as reverse_path
-            UNWIND range(0, size(reverse_path)-1) as i
-            WITH reverse_path[i] as method_node, i as depth
-            MATCH (method_node)<-[:HAS_METHOD]-(method_class:Class)
-            RETURN method_class.name as caller_class, method_class.file_path as caller_file,
-                   method_node.name as caller_method, method_node.visibility as caller_visibility,
-                   depth
-        }
-        RETURN caller_class, caller_file, caller_method, caller_visibility, depth
-        ORDER BY depth, caller_class, caller_method
-        """
-        
+        max_depth = max(1, min(int(max_depth), MAX_TRAVERSAL_DEPTH))
+        query = _REVERSE_CALL_STACK_QUERY % max_depth
         reverse_stack = {
             "target": {"class": class_name, "method": method_name},
             "callers": {},
             "max_depth": max_depth
         }
         
-        with self.driver.session() as session:
-            result = session.run(query, class_name=class_name, method_name=method_name, max_depth=max_depth)
+        with self._session() as session:
+            result = session.execute_read(_fetch_traversal, query, {"class_name": class_name, "method_name": method_name})
             
-            for record in result:
-                depth = record["depth"]
-                caller_class = record["caller_class"]
-                caller_method = record["caller_method"]
-                caller_visibility = record["caller_visibility"]
-                caller_file = record["caller_file"]
-                
-                depth_key = f"depth_{depth}"
-                if depth_key not in reverse_stack["callers"]:
-                    reverse_stack["callers"][depth_key] = []
-                
-                reverse_stack["callers"][depth_key].append({
+            callers = defaultdict(list)
+            for caller_class, caller_file, caller_method, caller_visibility, depth in result:
+                callers[f"depth_{depth}"].append({
                     "class": caller_class,
                     "method": caller_method,
                     "visibility": caller_visibility,
                     "file_path": caller_file
                 })
+            reverse_stack["callers"] = dict(callers)
         
         return reverse_stack
 
-    def get_call_statistics(self, class_name: str = None) -> Dict[str, Any]:
-        """Get detailed call statistics for analysis"""
-        if class_name:
-            # Implementation for specific class statistics
-            pass
-        else:
-            # Implementation for all classes statistics
-            pass
+    def get_call_statistics(self, class_name: str = None, limit: int = 500, after: str = None) -> Dict[str, Any]:
+        """Get per-method call statistics, one keyset-paginated page at a time
         
+        Methods are ordered by (class name, method name, class file); pass the
+        returned next_cursor (an opaque string) as `after` to fetch the following
+        page. The summary covers the whole filter and is only computed for the
+        first page. Raises ValueError for a malformed cursor.
+        """
+        after_class, after_method, after_file = _decode_statistics_cursor(after)
         statistics = {
             "class_filter": class_name,
             "methods": [],
-            "summary": {
-                "total_methods": 0,
-                "methods_with_calls": 0,
-                "methods_called_by_others": 0,
-                "total_call_relationships": 0
-            }
+            "summary": None,
+            "next_cursor": None
         }
         
-        with self.driver.session() as session:
-            # Implementation details would go here
-            pass
+        with self._session() as session:
+            result = session.execute_read(_fetch_records, _CALL_STATISTICS_QUERY, {
+                "class_name": class_name,
+                "after_class": after_class,
+                "after_method": after_method,
+                "after_file": after_file,
+                "limit": limit
+            })
+            
+            last_key = None
+            for record in result:
+                statistics["methods"].append({
+                    "class": record["class_name"],
+                    "method": record["method_name"],
+                    "visibility": record["visibility"],
+                    "calls_made": record["calls_made"],
+                    "called_by": record["called_by"]
+                })
+                last_key = (record["class_name"], record["method_name"], record["class_file"])
+            
+            # A full page means there may be more rows after the last key
+            if len(statistics["methods"]) == limit:
+                statistics["next_cursor"] = json.dumps(last_key)
+            
+            if after is None:
+                summary = session.execute_read(_fetch_single, _CALL_SUMMARY_QUERY, {"class_name": class_name})
+                statistics["summary"] = {
+                    "total_methods": summary["total_methods"],
+                    "methods_with_calls": summary["methods_with_calls"],
+                    "methods_called_by_others": summary["methods_called_by_others"],
+                    "total_call_relationships": summary["total_call_relationships"]
+                }
         
         return statistics
 
+    def iter_methods_for_review(self, page_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yield methods with their definitions for LLM review, fetched one page at a time"""
+        offset = 0
+        while True:
+            with self._session() as session:
+                records = session.execute_read(_fetch_records, _METHODS_FOR_REVIEW_QUERY, {"offset": offset, "page_size": page_size})
+            
+            for method_id, method_name, definition, visibility, class_name, file_path in records:
+                yield {
+                    "method_id": method_id,
+                    "method_name": method_name,
+                    "definition": definition,
+                    "visibility": visibility,
+                    "class_name": class_name,
+                    "file_path": file_path
+                }
+            
+            if len(records) < page_size:
+                return
+            offset += page_size
+    
     def get_all_methods_for_review(self) -> List[Dict[str, Any]]:
-        """Get all methods with their definitions for LLM review"""
-        query = """
-        MATCH (c:Class)-[:HAS_METHOD]->(m:Method)
-        WHERE m.definition IS NOT NULL AND m.definition <> ''
-        RETURN elementId(m) as method_id,
-               m.name as method_name,
-               m.definition as method_definition,
-               m.visibility as method_visibility,
-               c.name as class_name,
-               c.file_path as file_path
-        ORDER BY c.name, m.name
-        """
-        
-        methods = []
-        with self.driver.session() as session:
-            result = session.run(query)
-            for record in result:
-                methods.append({
-                    "method_id": record["method_id"],
-                    "method_name": record["method_name"],
-                    "definition": record["method_definition"],
-                    "visibility": record["method_visibility"],
-                    "class_name": record["class_name"],
-                    "file_path": record["file_path"]
-                })
-        
-        return methods
+        """Get all methods with their definitions for LLM review (deprecated: use iter_methods_for_review)"""
+        return list(self.iter_methods_for_review())
 
     def add_review(self, method_id: str, review_data: Dict[str, Any]) -> str:
         """Add a review node linked to a method"""
-        query = """
-        MATCH (m:Method) WHERE elementId(m) = $method_id
-        CREATE (r:Review {
-            method_name: $method_name,
-            class_name: $class_name,
-            severity: $severity,
-            issue_type: $issue_type,
-            description: $description,
-            recommendation: $recommendation,
-            line_reference: $line_reference,
-            created_at: datetime()
-        })
-        CREATE (m)-[:HAS_REVIEW]->(r)
-        RETURN elementId(r) as review_id
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query,
-                method_id=method_id,
-                method_name=review_data.get("method_name"),
-                class_name=review_data.get("class_name"),
-                severity=review_data.get("severity"),
-                issue_type=review_data.get("issue_type"),
-                description=review_data.get("description"),
-                recommendation=review_data.get("recommendation"),
-                line_reference=review_data.get("line_reference")
-            )
-            return result.single()["review_id"]
-
-    def clear_existing_reviews(self):
-        """Clear all existing review nodes"""
-        query = """
-        MATCH (r:Review)
-        DETACH DELETE r
-        """
+        with self._session() as session:
+            record = session.execute_write(_fetch_single, _ADD_REVIEW_QUERY, {
+                "method_id": method_id,
+                "method_name": review_data.get("method_name"),
+                "class_name": review_data.get("class_name"),
+                "severity": review_data.get("severity"),
+                "issue_type": review_data.get("issue_type"),
+                "description": review_data.get("description"),
+                "recommendation": review_data.get("recommendation"),
+                "line_reference": review_data.get("line_reference")
+            })
+            return record["review_id"]
+
+    def mark_graph_changed(self):
+        """Give the graph a new generation stamp so web server workers drop their caches"""
+        with self._session() as session:
+            session.execute_write(lambda tx: tx.run(_MARK_GRAPH_CHANGED_QUERY).consume())
+    
+    def clear_existing_reviews(self, chunk_size: int = 10000):
+        """Clear all existing review nodes, committing every chunk_size deletions server-side"""
+        # CALL ... IN TRANSACTIONS only runs in an auto-commit transaction (session.run)
+        query = _CLEAR_REVIEWS_QUERY % chunk_size
         
-        with self.driver.session() as session:
-            session.run(query)
+        with self._session() as session:
+            session.run(query).consume()
@@ -2,14 +2,39 @@
 LLM client for generating codebase review plans
 """
 import os
+import time
+import atexit
+import functools
+import importlib.util
+import threading
 import httpx
 import requests
 import json
+from typing import Optional
+import orjson
 from openai import OpenAI
 
+# Bearer token shared by every LLM call until shortly before it expires
+_cached_token = {'access_token': None, 'expires_at': 0.0}
+_token_lock = threading.Lock()
+# Seconds before expiry at which the token is refreshed, so it can't lapse mid-request
+_TOKEN_EXPIRY_MARGIN = 60
+
 
 def get_bearer_token():
-    """Get bearer token using Client Credentials OAuth flow"""
+    """Get bearer token using Client Credentials OAuth flow (cached until close to expiry)"""
+    with _token_lock:
+        if _cached_token['access_token'] and time.time() < _cached_token['expires_at'] - _TOKEN_EXPIRY_MARGIN:
+            return _cached_token['access_token']
+        
+        token_data = _request_bearer_token()
+        _cached_token['access_token'] = token_data['access_token']
+        _cached_token['expires_at'] = time.time() + float(token_data.get('expires_in') or 3600)
+        return _cached_token['access_token']
+
+
+def _request_bearer_token():
+    """Request a new token from the auth URL and return the token response"""
     auth_url = os.getenv('APIGEE_AUTH_URL')
     client_id = os.getenv('APIGEE_CLIENT_ID')
     client_secret = os.getenv('APIGEE_CLIENT_SECRET')
@@ -47,7 +72,7 @@ def get_bearer_token():
         if not access_token:
             raise ValueError("No access_token found in response")
             
-        return access_token
+        return token_data
         
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to get bearer token: {str(e)}")
@@ -56,20 +81,35 @@ def get_bearer_token():
 
 
 def initialize_llm_client():
-    """Initialize OpenAI client with Intel's internal API"""
+    """Initialize OpenAI client with Intel's internal API (reused while the token is valid)"""
     try:
         api_key = get_bearer_token()
     except Exception:
         return None
     
+    return _build_llm_client(api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _http_client():
+    """Shared HTTP client for every LLM call, so connections stay alive across calls and token refreshes"""
     proxy_url = os.getenv('HTTPS_PROXY') or os.getenv('HTTP_PROXY')
     
     http_client = httpx.Client(
         proxy=proxy_url,
         timeout=120.0,
-        verify=False
-    ) if proxy_url else None
-    
+        verify=not proxy_url,  # The corporate proxy re-signs TLS, so verification is off behind it
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        # HTTP/2 multiplexes concurrent reviews over one connection; it needs the h2 package
+        http2=importlib.util.find_spec('h2') is not None
+    )
+    atexit.register(http_client.close)
+    return http_client
+
+
+@functools.lru_cache(maxsize=1)
+def _build_llm_client(api_key):
+    """Build the OpenAI client for a bearer token; a refreshed token builds a new one"""
     base_url = "https://apis-internal.intel.com/generativeaiinference/v4"
     
     client = OpenAI(
@@ -77,14 +117,22 @@ def initialize_llm_client():
         base_url=base_url,
         timeout=120.0,
         max_retries=3,
-        http_client=http_client
+        http_client=_http_client()
     )
     
     return client
 
 
-def generate_entrypoints_list(text_tree, project_path):
-    """Generate a list of entry points in the codebase using LLM"""
+def _strip_code_fence(content: str) -> str:
+    """Remove a markdown code block wrapper (```json ... ``` or ``` ... ```) if the model added one"""
+    content = content.strip()
+    if content.startswith('```'):
+        content = content.removeprefix('```json').removeprefix('```').removesuffix('```').strip()
+    return content
+
+
+def generate_entrypoints_list(text_tree, project_path) -> Optional[list]:
+    """Generate a list of entry points in the codebase using LLM, parsed from its JSON reply"""
     client = initialize_llm_client()
     if not client:
         return None
@@ -136,10 +184,17 @@ def generate_entrypoints_list(text_tree, project_path):
             stream=False
         )
         
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
         
     except Exception:
         return None
+    
+    try:
+        return orjson.loads(_strip_code_fence(content))
+    except orjson.JSONDecodeError as e:
+        print(f"❌ Failed to parse JSON response: {e}")
+        print(f"Raw response: {content}")
+        return None
 
 
 def review_csharp_methods(methods_data, file_path):
@@ -5,9 +5,26 @@ Different languages may have different graph structures:
 - Python: Module-function graphs or class-method graphs depending on code structure
 - JavaScript: Module-function graphs or prototype-based relationships
 """
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Dict, Any
 
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 8
+
+# Parsers built inside pool worker processes, one per parser class, reused across files
+_worker_parsers: Dict[type, "BaseParser"] = {}
+
+
+def _parse_in_worker(parser_class: type, file_path: str) -> Dict[str, Any]:
+    """Parse one file in a pool worker with that worker's own parser instance"""
+    parser = _worker_parsers.get(parser_class)
+    if parser is None:
+        parser = _worker_parsers[parser_class] = parser_class()
+    return parser._parse_or_error(file_path)
+
 
 class BaseParser(ABC):
     """Abstract base class for language parsers"""
@@ -39,21 +56,31 @@ class BaseParser(ABC):
         """
         pass
     
-    def parse_files(self, file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    def parse_files(self, file_paths: List[str], max_workers: int = None) -> Dict[str, Dict[str, Any]]:
         """
-        Parse multiple files
+        Parse multiple files, spreading them over a process pool when there are enough
         
         Args:
             file_paths: List of file paths to parse
+            max_workers: Worker processes to use (default: CPU count; 1 parses in this process)
             
         Returns:
             Dictionary mapping file paths to parsed information
         """
-        results = {}
-        for file_path in file_paths:
-            try:
-                results[file_path] = self.parse_file(file_path)
-            except Exception as e:
-                print(f"Error parsing {file_path}: {e}")
-                results[file_path] = {"error": str(e)}
-        return results
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(file_paths) < PARALLEL_MIN_FILES:
+            return {file_path: self._parse_or_error(file_path) for file_path in file_paths}
+        
+        # Parsing is CPU-bound, so files are parsed in separate processes rather than threads;
+        # each worker builds its own parser since tree-sitter objects don't pickle
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(partial(_parse_in_worker, type(self)), file_paths, chunksize=16)
+            return dict(zip(file_paths, parsed))
+    
+    def _parse_or_error(self, file_path: str) -> Dict[str, Any]:
+        """Parse one file, returning {"error": ...} instead of raising"""
+        try:
+            return self.parse_file(file_path)
+        except Exception as e:
+            print(f"Error parsing {file_path}: {e}")
+            return {"error": str(e)}
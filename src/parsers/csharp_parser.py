@@ -2,19 +2,74 @@
 C# parser using tree-sitter for building class-method graphs
 """
 import os
+import codecs
+import threading
+from bisect import bisect_left
 from typing import List, Dict, Any
 import tree_sitter_c_sharp as tscsharp
-from tree_sitter import Language, Parser
+from tree_sitter import Language, Parser, Query, QueryCursor
 from .base_parser import BaseParser
 
+# Every node the parser cares about, matched by tree-sitter in C in a single pass over
+# the tree; @member only matches the member access a call is made through (obj.Method())
+_STRUCTURE_QUERY = """
+(class_declaration) @class
+(method_declaration) @method
+(invocation_expression) @call
+(invocation_expression (member_access_expression) @member)
+"""
+
+# The grammar and the compiled query are immutable, so every parser instance shares them
+_LANGUAGE = Language(tscsharp.language())
+_STRUCTURE = Query(_LANGUAGE, _STRUCTURE_QUERY)
+
+
+# Keywords the extractors compare node text against
+_VISIBILITY = frozenset(('public', 'private', 'protected', 'internal'))
+_METHOD_TYPE_KEYWORDS = frozenset(('void', 'int', 'string', 'bool', 'Task', 'ActionResult', 'IActionResult', 'async', 'static'))
+
+# A node spanning more bytes than the longest visibility keyword can't be one, so its
+# text is never decoded
+_KEYWORD_MAX_BYTES = max(len(keyword) for keyword in _VISIBILITY)
+
+
+def _node_text(content: memoryview, node) -> str:
+    """Decode the source text of a node; tree-sitter positions are byte offsets into the UTF-8 source"""
+    return str(content[node.start_byte:node.end_byte], 'utf-8', 'replace')
+
+
+def _keyword_text(content: memoryview, node) -> str:
+    """Text of a node short enough to be a keyword, or '' for longer nodes such as bodies"""
+    if node.end_byte - node.start_byte <= _KEYWORD_MAX_BYTES:
+        return _node_text(content, node).strip()
+    return ''
+
+
+def _preorder(nodes) -> list:
+    """Sort captured nodes into document pre-order (an enclosing node before the nodes inside it)"""
+    return sorted(nodes, key=lambda node: (node.start_byte, -node.end_byte))
+
+
+def _within(nodes: list, starts: List[int], node) -> list:
+    """Slice the pre-ordered nodes that lie inside node's byte range"""
+    return nodes[bisect_left(starts, node.start_byte):bisect_left(starts, node.end_byte)]
+
 
 class CSharpParser(BaseParser):
     """C# parser implementation for generating class-method graphs using tree-sitter"""
     
     def __init__(self):
-        self.language = Language(tscsharp.language())
-        self.parser = Parser()
-        self.parser.language = self.language
+        self.language = _LANGUAGE
+        self.query = _STRUCTURE
+        self._local = threading.local()
+    
+    @property
+    def parser(self) -> Parser:
+        """This thread's tree-sitter parser (a Parser must not parse on two threads at once)"""
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = Parser(_LANGUAGE)
+        return parser
     
     def get_supported_extensions(self) -> List[str]:
         """Get C# file extensions"""
@@ -33,10 +88,17 @@ class CSharpParser(BaseParser):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8-sig') as f:  # Use utf-8-sig to handle BOM
-            content = f.read()
-        
-        tree = self.parser.parse(content.encode('utf-8'))
+        # tree-sitter parses bytes, so the file is never decoded as a whole; node text is
+        # decoded slice by slice only where it's needed
+        with open(file_path, 'rb') as f:
+            source = f.read()
+        # Slices of a memoryview share the file's buffer instead of copying it, so neither
+        # skipping a BOM nor slicing node text copies the source
+        content = memoryview(source)
+        if source.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        
+        tree = self.parser.parse(content)
         root_node = tree.root_node
         
         result = {
@@ -50,125 +112,95 @@ class CSharpParser(BaseParser):
         
         return result
     
-    def _find_classes(self, node, content: str) -> List[Dict[str, Any]]:
-        """Find all class declarations in the syntax tree"""
-        classes = []
+    def _find_classes(self, root_node, content: memoryview) -> List[Dict[str, Any]]:
+        """Find all class declarations and their methods from one tree-sitter query over the file"""
+        captures = QueryCursor(self.query).captures(root_node)
+        
+        methods = _preorder(captures.get('method', []))
+        method_starts = [node.start_byte for node in methods]
+        calls = _preorder(captures.get('call', []) + captures.get('member', []))
+        call_starts = [node.start_byte for node in calls]
         
-        # Look for class declarations
-        if node.type == 'class_declaration':
-            class_info = self._extract_class_info(node, content)
-            if class_info:
-                classes.append(class_info)
+        # Each method is extracted once, then listed under every class whose body holds it
+        # (so a method in a nested class also appears under its outer classes)
+        method_infos = {}
         
-        # Recursively search child nodes
-        for child in node.children:
-            classes.extend(self._find_classes(child, content))
+        def method_info_at(index):
+            if index not in method_infos:
+                method_node = methods[index]
+                method_infos[index] = self._extract_method_info(method_node, content, _within(calls, call_starts, method_node))
+            return method_infos[index]
+        
+        classes = []
+        for class_node in _preorder(captures.get('class', [])):
+            class_info = self._extract_class_info(class_node, content)
+            if not class_info:
+                continue
+            classes.append(class_info)
+            
+            # Only methods inside the class body belong to the class
+            body = next((child for child in class_node.children if child.type == 'declaration_list'), None)
+            if body is None:
+                continue
+            first = bisect_left(method_starts, body.start_byte)
+            last = bisect_left(method_starts, body.end_byte)
+            for index in range(first, last):
+                method_info = method_info_at(index)
+                if method_info:
+                    class_info["methods"].append(method_info)
         
         return classes
     
-    def _extract_class_info(self, class_node, content: str) -> Dict[str, Any]:
-        """Extract class name and methods from a class declaration node"""
+    def _extract_class_info(self, class_node, content: memoryview) -> Dict[str, Any]:
+        """Extract class name and visibility from a class declaration node"""
         class_name = None
         class_visibility = "private"  # Default visibility
-        methods = []
         
-        # Find class visibility and name
-        found_class_keyword = False
+        # One pass over the children: modifiers come first, then the 'class' keyword and
+        # the name identifier, which ends the scan before the body
         for child in class_node.children:
-            child_text = content[child.start_byte:child.end_byte].strip()
-            
-            # Check for visibility modifiers
-            if child_text in ['public', 'private', 'protected', 'internal']:
-                class_visibility = child_text
-            elif child.type == 'class' or child_text == 'class':
-                found_class_keyword = True
-            elif child.type == 'identifier' and found_class_keyword:
-                class_name = child_text
+            child_type = child.type
+            if child_type == 'modifier':
+                modifier = _node_text(content, child)
+                if modifier in _VISIBILITY:
+                    class_visibility = modifier
+            elif child_type == 'identifier':
+                class_name = _node_text(content, child)
                 break
-            elif child.type == 'identifier' and not found_class_keyword:
-                # Sometimes the identifier comes before we see the 'class' keyword
-                # Check if this looks like a class name (starts with uppercase)
-                if child_text and child_text[0].isupper() and child_text not in ['public', 'private', 'protected', 'internal', 'static', 'abstract', 'sealed', 'partial']:
-                    class_name = child_text
-        
-        if not class_name:
-            # Fallback: look for any identifier that could be a class name
-            for child in class_node.children:
-                if child.type == 'identifier':
-                    potential_name = content[child.start_byte:child.end_byte].strip()
-                    if potential_name and potential_name[0].isupper():
-                        class_name = potential_name
-                        break
         
         if not class_name:
             return None
         
-        # Find class body
-        class_body = None
-        for child in class_node.children:
-            if child.type == 'declaration_list':
-                class_body = child
-                break
-        
-        if class_body:
-            methods = self._find_methods(class_body, content)
-        
         return {
             "name": class_name,
             "visibility": class_visibility,
-            "methods": methods
+            "methods": []  # Filled in by _find_classes
         }
     
-    def _find_methods(self, node, content: str) -> List[Dict[str, Any]]:
-        """Find all method declarations in a class body"""
-        methods = []
-        
-        # Look for method declarations
-        if node.type == 'method_declaration':
-            method_info = self._extract_method_info(node, content)
-            if method_info:
-                methods.append(method_info)
-        
-        # Recursively search child nodes
-        for child in node.children:
-            methods.extend(self._find_methods(child, content))
-        
-        return methods
-    
-    def _extract_method_info(self, method_node, content: str) -> Dict[str, Any]:
-        """Extract method information from a method declaration node"""
+    def _extract_method_info(self, method_node, content: memoryview, call_nodes: list) -> Dict[str, Any]:
+        """Extract method information from a method declaration node and the call nodes inside it"""
         method_name = None
         visibility = "public"  # Default to public for controllers (most common)
         
-        # Debug: Print the node structure
-        # print(f"Method node type: {method_node.type}")
-        # for i, child in enumerate(method_node.children):
-        #     child_text = content[child.start_byte:child.end_byte]
-        #     print(f"  Child {i}: {child.type} = '{child_text}'")
-        
-        # Look for modifiers first
-        modifiers = []
+        # Look for a visibility modifier first
         for child in method_node.children:
-            child_text = content[child.start_byte:child.end_byte].strip()
-            if child.type in ['modifier', 'modifiers'] or child_text in ['public', 'private', 'protected', 'internal', 'static', 'async', 'virtual', 'override']:
-                modifiers.append(child_text)
-                if child_text in ['public', 'private', 'protected', 'internal']:
-                    visibility = child_text
+            child_text = _keyword_text(content, child)
+            if child_text in _VISIBILITY:
+                visibility = child_text
         
         # Find the method name - it's usually an identifier that comes after modifiers and return type
         identifiers = []
         for child in method_node.children:
             if child.type == 'identifier':
-                identifier_text = content[child.start_byte:child.end_byte]
+                identifier_text = _node_text(content, child)
                 identifiers.append(identifier_text)
         
         # The method name is typically the last identifier before the parameter list
         # or the first identifier that's not a type name
         if identifiers:
             # Skip common type names and find the actual method name
-            type_keywords = {'void', 'int', 'string', 'bool', 'Task', 'ActionResult', 'IActionResult', 'async', 'static'}
             for identifier in identifiers:
-                if identifier not in type_keywords and not identifier.startswith('I') and identifier[0].isupper():
+                if identifier not in _METHOD_TYPE_KEYWORDS and not identifier.startswith('I') and identifier[0].isupper():
                     method_name = identifier
                     break
             
@@ -180,10 +212,10 @@ class CSharpParser(BaseParser):
             return None
         
         # Find method calls within this method
-        method_calls = self._find_method_calls_in_method(method_node, content)
+        method_calls = self._find_method_calls_in_method(call_nodes, content)
         
         # Extract the entire method definition text
-        method_definition = content[method_node.start_byte:method_node.end_byte].strip()
+        method_definition = _node_text(content, method_node).strip()
         
         return {
             "name": method_name,
@@ -192,80 +224,50 @@ class CSharpParser(BaseParser):
             "definition": method_definition
         }
     
-    def _find_method_calls_in_method(self, method_node, content: str) -> List[str]:
+    def _find_method_calls_in_method(self, call_nodes: list, content: memoryview) -> List[str]:
         """
-        Find all method calls within a method body using a generic approach.
+        Collect the distinct names called from a method's invocation nodes, in source order.
         This is specifically designed for C# class-method graph generation.
         For other languages (like Python), different approaches may be needed.
         """
-        method_calls = []
+        # Insertion-ordered dict as an ordered set: O(1) de-duplication, source order kept
+        method_calls = {}
         
-        def traverse_for_calls(node):
-            """Recursively traverse the tree to find method calls"""
-            # Look for different types of method call patterns
-            if node.type in ['invocation_expression', 'method_invocation', 'call_expression']:
+        for node in call_nodes:
+            if node.type == 'invocation_expression':
                 # Extract the method name from the invocation
                 call_name = self._extract_call_name_from_invocation(node, content)
-                if call_name and call_name not in method_calls:
-                    method_calls.append(call_name)
+            else:
+                # The member access the invocation is made through (obj.Method)
+                call_name = self._extract_method_name_from_member_access(node, content)
             
-            # Also look for member access expressions that might be method calls
-            elif node.type == 'member_access_expression':
-                # Check if this member access is part of an invocation
-                parent = node.parent
-                if parent and parent.type in ['invocation_expression', 'method_invocation', 'call_expression']:
-                    call_name = self._extract_method_name_from_member_access(node, content)
-                    if call_name and call_name not in method_calls:
-                        method_calls.append(call_name)
-            
-            # Continue traversing children
-            for child in node.children:
-                traverse_for_calls(child)
-        
-        # Start traversal from the method node
-        traverse_for_calls(method_node)
+            if call_name:
+                method_calls[call_name] = None
         
-        return method_calls
+        return list(method_calls)
     
-    def _extract_call_name_from_invocation(self, invocation_node, content: str) -> str:
+    def _extract_call_name_from_invocation(self, invocation_node, content: memoryview) -> str:
         """Extract method name from an invocation expression"""
         # Look for the method name in the invocation
         for child in invocation_node.children:
             if child.type == 'identifier':
-                return content[child.start_byte:child.end_byte]
+                return _node_text(content, child)
             elif child.type == 'member_access_expression':
                 # For method calls like obj.Method(), get the last identifier
                 return self._extract_method_name_from_member_access(child, content)
         
         return None
     
-    def _extract_method_name_from_member_access(self, member_access_node, content: str) -> str:
+    def _extract_method_name_from_member_access(self, member_access_node, content: memoryview) -> str:
         """Extract method name from member access expression (e.g., obj.Method)"""
         # The method name is typically the last identifier in a member access
         identifiers = []
         for child in member_access_node.children:
             if child.type == 'identifier':
-                identifiers.append(content[child.start_byte:child.end_byte])
+                identifiers.append(_node_text(content, child))
         
         # Return the last identifier (the method name)
         if identifiers:
             return identifiers[-1]
         
         return None
-    
-    def _debug_print_tree(self, node, content: str, depth: int = 0, max_depth: int = 3):
-        """Debug function to print tree structure"""
-        if depth > max_depth:
-            return
-        
-        indent = "  " * depth
-        node_text = content[node.start_byte:node.end_byte]
-        # Limit text length for readability
-        if len(node_text) > 50:
-            node_text = node_text[:47] + "..."
-        node_text = node_text.replace('\n', '\\n').replace('\r', '\\r')
-        
-        print(f"{indent}{node.type}: '{node_text}'")
-        
-        for child in node.children:
-            self._debug_print_tree(child, content, depth + 1, max_depth)
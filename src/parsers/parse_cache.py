@@ -0,0 +1,94 @@
+"""
+Persistent cache of parsing results, so unchanged files are not parsed again on the next run
+"""
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+# Part of every cache key; bump it whenever a parser's output changes so results
+# cached by an older parser are never reused
+PARSE_CACHE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    path TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (path, sha)
+)
+"""
+
+
+class ParseCache:
+    """SQLite store of parsing results keyed by (absolute path, SHA-256 of the file contents)"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        # One connection for the cache's lifetime, shared under a lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+    
+    @staticmethod
+    def _key(language: str, file_path: str) -> Optional[Tuple[str, str]]:
+        """Cache key of a file, or None if it can't be read (the parser reports that error)"""
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        
+        digest = hashlib.sha256(f"{PARSE_CACHE_VERSION}:{language}:".encode())
+        digest.update(content)
+        return os.path.abspath(file_path), digest.hexdigest()
+    
+    def lookup(self, language: str, file_paths: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Tuple[str, str]]]:
+        """
+        Find cached results for files whose contents haven't changed
+        
+        Returns:
+            (cached results by file path, cache keys of the files to pass back to store)
+        """
+        keys = {}
+        for file_path in file_paths:
+            key = self._key(language, file_path)
+            if key is not None:
+                keys[file_path] = key
+        
+        hits = {}
+        with self._lock:
+            for file_path, key in keys.items():
+                row = self.conn.execute("SELECT result FROM parse_cache WHERE path = ? AND sha = ?", key).fetchone()
+                if row is not None:
+                    result = hits[file_path] = json.loads(row[0])
+                    if 'file_path' in result:
+                        # The entry may have been stored under another spelling of the same path
+                        result['file_path'] = file_path
+        return hits, keys
+    
+    def store(self, keys: Dict[str, Tuple[str, str]], results: Dict[str, Dict[str, Any]]):
+        """Cache freshly parsed results under the keys lookup returned (errors are not cached)"""
+        rows = [
+            (*keys[file_path], json.dumps(result))
+            for file_path, result in results.items()
+            if file_path in keys and 'error' not in result
+        ]
+        if not rows:
+            return
+        
+        with self._lock:
+            # Older entries for the same paths describe contents that no longer exist
+            self.conn.executemany("DELETE FROM parse_cache WHERE path = ?", [(path,) for path, _, _ in rows])
+            self.conn.executemany("INSERT OR REPLACE INTO parse_cache (path, sha, result) VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+    
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self.conn.close()
@@ -8,12 +8,18 @@ import os
 from typing import List, Dict, Any
 from .base_parser import BaseParser
 from .csharp_parser import CSharpParser
+from .parse_cache import ParseCache
 
 
 class ParserManager:
     """Manages multiple language parsers"""
     
-    def __init__(self):
+    def __init__(self, cache_path: str = None):
+        """
+        Args:
+            cache_path: SQLite file caching parsing results of unchanged files across runs (None disables it)
+        """
+        self.cache = ParseCache(cache_path) if cache_path else None
         self.parsers = {
             'csharp': CSharpParser(),  # Generates class-method graphs
             # Add more parsers here for other languages with appropriate structures:
@@ -21,6 +27,12 @@ class ParserManager:
             # 'java': JavaParser(),      # Would generate class-method graphs like C#
             # 'javascript': JSParser(),  # Could generate module-function or prototype graphs
         }
+        # Lowercase file extension -> language, so grouping is one lookup per file
+        self._ext_to_lang = {
+            ext.lower(): name
+            for name, parser in self.parsers.items()
+            for ext in parser.get_supported_extensions()
+        }
     
     def group_files_by_language(self, file_paths: List[str]) -> Dict[str, List[str]]:
         """
@@ -33,15 +45,12 @@ class ParserManager:
             Dictionary mapping language names to lists of file paths
         """
         grouped_files = {}
+        ext_to_lang = self._ext_to_lang
         
-        for parser_name, parser in self.parsers.items():
-            supported_extensions = parser.get_supported_extensions()
-            matching_files = [
-                path for path in file_paths 
-                if any(path.lower().endswith(ext.lower()) for ext in supported_extensions)
-            ]
-            if matching_files:
-                grouped_files[parser_name] = matching_files
+        for path in file_paths:
+            language = ext_to_lang.get(os.path.splitext(path)[1].lower())
+            if language is not None:
+                grouped_files.setdefault(language, []).append(path)
         
         return grouped_files
     
@@ -60,12 +69,30 @@ class ParserManager:
         for language, file_paths in grouped_files.items():
             if language in self.parsers:
                 parser = self.parsers[language]
-                results[language] = parser.parse_files(file_paths)
+                if self.cache is None:
+                    results[language] = parser.parse_files(file_paths)
+                else:
+                    results[language] = self._parse_files_cached(language, parser, file_paths)
             else:
                 print(f"No parser available for language: {language}")
         
         return results
     
+    def _parse_files_cached(self, language: str, parser: BaseParser, file_paths: List[str]) -> Dict[str, Any]:
+        """Parse only the files whose contents changed since they were cached, and cache those"""
+        cached, keys = self.cache.lookup(language, file_paths)
+        parsed = parser.parse_files([path for path in file_paths if path not in cached])
+        self.cache.store(keys, parsed)
+        
+        if cached:
+            print(f"   • Reused cached results for {len(cached)} unchanged {language} files")
+        return {path: cached[path] if path in cached else parsed[path] for path in file_paths}
+    
+    def close(self):
+        """Close the parse cache, if any"""
+        if self.cache is not None:
+            self.cache.close()
+    
     def extract_files_from_entrypoints(self, entrypoints: List[Dict[str, Any]], project_path: str = None) -> List[str]:
         """
         Extract unique file paths from entrypoints list
@@ -26,33 +26,36 @@ def get_directory_tree(root_path):
     
     tree_items = []
     
-    def scan_directory(current_path, level=0):
+    def scan_directory(current_path, level=0, rel_prefix=''):
         try:
-            items = sorted(os.listdir(current_path))
-            for item in items:
-                item_path = os.path.join(current_path, item)
-                
+            # scandir entries carry their name and file type from the directory read, so
+            # there is no stat or path join per entry
+            with os.scandir(current_path) as it:
                 # Always skip .git directories
-                if item == '.git':
-                    continue
+                entries = sorted((entry for entry in it if entry.name != '.git'), key=lambda entry: entry.name)
+            is_dirs = [entry.is_dir() for entry in entries]
+            
+            # Match the whole directory against .gitignore in one call; directories are
+            # also checked with a trailing slash
+            ignored = ()
+            if gitignore_spec:
+                candidates = [rel_prefix + entry.name for entry in entries]
+                candidates += [rel_prefix + entry.name + '/' for entry, is_dir in zip(entries, is_dirs) if is_dir]
+                ignored = set(gitignore_spec.match_files(candidates))
+            
+            for entry, is_dir in zip(entries, is_dirs):
+                item = entry.name
                 
                 # Skip if ignored by .gitignore
-                if gitignore_spec:
-                    rel_path = os.path.relpath(item_path, root_path).replace('\\', '/')
-                    
-                    # For directories, also check with trailing slash
-                    if os.path.isdir(item_path):
-                        if gitignore_spec.match_file(rel_path) or gitignore_spec.match_file(rel_path + '/'):
-                            continue
-                    else:
-                        if gitignore_spec.match_file(rel_path):
-                            continue
+                rel_path = rel_prefix + item
+                if rel_path in ignored or (is_dir and rel_path + '/' in ignored):
+                    continue
                 
-                if os.path.isdir(item_path):
-                    tree_items.append(('folder', item, level, item_path))
-                    scan_directory(item_path, level + 1)
+                if is_dir:
+                    tree_items.append(('folder', item, level, entry.path))
+                    scan_directory(entry.path, level + 1, rel_path + '/')
                 else:
-                    tree_items.append(('file', item, level, item_path))
+                    tree_items.append(('file', item, level, entry.path))
         except (PermissionError, Exception):
             pass  # Silently skip inaccessible directories
     
@@ -64,35 +67,31 @@ def generate_text_tree(tree_items, root_name):
     """Generate text-based directory tree"""
     tree_lines = [root_name]
     
-    for item_type, name, level, full_path in tree_items:
-        # Create indentation based on level
-        indent = "│   " * level
-        
+    # One backward pass: an item is the last at its level unless a sibling follows it
+    # before the listing climbs back to a shallower level
+    is_last_at_level = [True] * len(tree_items)
+    sibling_follows = []  # sibling_follows[level]: a later item at this level shares the parent
+    max_level = 0
+    for index in range(len(tree_items) - 1, -1, -1):
+        level = tree_items[index][2]
+        max_level = max(max_level, level)
+        del sibling_follows[level + 1:]
+        sibling_follows.extend([False] * (level + 1 - len(sibling_follows)))
+        is_last_at_level[index] = not sibling_follows[level]
+        sibling_follows[level] = True
+    
+    # Indentation of an item's connector: one "│   " per ancestor level below the root
+    indents = ["│   " * (level - 1) for level in range(max_level + 1)]
+    
+    for index, (item_type, name, level, full_path) in enumerate(tree_items):
         # Use different symbols for folders and files
-        if item_type == 'folder':
-            symbol = "📁"
-        else:
-            symbol = "📄"
+        symbol = "📁" if item_type == 'folder' else "📄"
         
         # Add tree structure characters
         if level > 0:
-            tree_char = "├── "
-            # Check if this is the last item at this level
-            is_last = True
-            current_index = tree_items.index((item_type, name, level, full_path))
-            for next_item in tree_items[current_index + 1:]:
-                if next_item[2] <= level:  # next_item[2] is level
-                    if next_item[2] == level:
-                        is_last = False
-                    break
-            
-            if is_last:
-                tree_char = "└── "
-            
-            line = indent[:-4] + tree_char + f"{symbol} {name}"
+            tree_char = "└── " if is_last_at_level[index] else "├── "
+            tree_lines.append(''.join((indents[level], tree_char, symbol, ' ', name)))
         else:
-            line = f"{symbol} {name}"
-        
-        tree_lines.append(line)
+            tree_lines.append(''.join((symbol, ' ', name)))
     
     return '\n'.join(tree_lines)
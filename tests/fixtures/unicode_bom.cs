@@ -0,0 +1,28 @@
+﻿// Übersicht: Grüße aus München — 日本語のコメント
+namespace Café
+{
+    public class Größe
+    {
+        private string straße = "Ärger ✓";
+
+        public void Berechne()
+        {
+            var text = "naïve — 東京";
+            Helfer.Prüfe(text);
+            Zähle();
+        }
+
+        private int Zähle()
+        {
+            return straße.Length;
+        }
+    }
+
+    internal class Helfer
+    {
+        public static void Prüfe(string wert)
+        {
+            Console.WriteLine(wert);
+        }
+    }
+}
@@ -0,0 +1,127 @@
+"""
+Tests for flattening parsing results into interned import columns
+"""
+import os
+import unittest
+
+from src.database.neo4j_graph_db import _parsing_columns, _intern_columns, _drop_rows, _INTERNED_COLUMNS
+
+PARSING_RESULTS = {
+    "csharp": {
+        "Orders.cs": {
+            "classes": [{
+                "name": "OrderService",
+                "visibility": "public",
+                "methods": [
+                    {"name": "Place", "visibility": "public", "method_calls": ["Validate", "Save"], "definition": "void Place() {}"},
+                    {"name": "Validate", "visibility": "private", "method_calls": [], "definition": "bool Validate() {}"},
+                ],
+            }],
+        },
+        "Store.cs": {
+            "classes": [{
+                "name": "OrderStore",
+                "visibility": "internal",
+                "methods": [
+                    {"name": "Save", "visibility": "protected internal", "method_calls": ["Validate"], "definition": None},
+                ],
+            }],
+        },
+        "Broken.cs": {"error": "could not parse"},
+    }
+}
+
+
+def _decode(encoded):
+    """Undo _intern_columns: look every interned index up in the names list"""
+    names = encoded["names"]
+    return {
+        column: [names[index] for index in values] if column in _INTERNED_COLUMNS else values
+        for column, values in encoded.items()
+        if column != "names"
+    }
+
+
+class ParsingColumnsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.classes, cls.methods, cls.calls = _parsing_columns(PARSING_RESULTS)
+
+    def test_columns(self):
+        self.assertEqual(self.classes, {
+            "name": ["OrderService", "OrderStore"],
+            "file_path": [os.path.normpath("Orders.cs"), os.path.normpath("Store.cs")],
+            "visibility": ["Public", "Internal"],
+        })
+        self.assertEqual(self.methods["name"], ["Place", "Validate", "Save"])
+        self.assertEqual(self.methods["visibility"], ["Public", "Private", "Protected Internal"])
+        self.assertEqual(self.calls, {
+            "class_name": ["OrderService", "OrderService", "OrderStore"],
+            "method_name": ["Place", "Place", "Save"],
+            "called_method_name": ["Validate", "Save", "Validate"],
+        })
+
+    def test_content_hash_tracks_method_content(self):
+        hashes = self.methods["content_hash"]
+        self.assertEqual(len(set(hashes)), 3)
+        _, again, _ = _parsing_columns(PARSING_RESULTS)
+        self.assertEqual(again["content_hash"], hashes)
+
+    def test_intern_round_trip(self):
+        for columns in (self.classes, self.methods, self.calls):
+            encoded = _intern_columns(columns)
+            self.assertEqual(_decode(encoded), columns)
+
+    def test_interned_names_are_distinct(self):
+        encoded = _intern_columns(self.calls)
+        self.assertEqual(sorted(encoded["names"]), ["OrderService", "OrderStore", "Place", "Save", "Validate"])
+        self.assertEqual(encoded["called_method_name"], [encoded["names"].index(name) for name in self.calls["called_method_name"]])
+
+
+class OverloadHashTest(unittest.TestCase):
+    """Overloads share one Method node, so re-imports must keep or skip them as a group"""
+
+    RESULTS = {
+        "csharp": {
+            "Runner.cs": {
+                "classes": [{
+                    "name": "Runner",
+                    "visibility": "public",
+                    "methods": [
+                        {"name": "Run", "visibility": "public", "method_calls": [], "definition": "void Run() {}"},
+                        {"name": "Run", "visibility": "public", "method_calls": ["Step"], "definition": "void Run(int n) { Step(); }"},
+                        {"name": "Step", "visibility": "private", "method_calls": [], "definition": "void Step() {}"},
+                    ],
+                }],
+            },
+        }
+    }
+
+    def _import(self, stored):
+        """Mimic a re-import: drop rows whose hash is stored, then store what's left, last row winning"""
+        _, methods, _ = _parsing_columns(self.RESULTS)
+        keep = [
+            stored.get((class_name, name)) != content_hash
+            for class_name, name, content_hash in zip(methods["class_name"], methods["name"], methods["content_hash"])
+        ]
+        written = _drop_rows(methods, keep)
+        for class_name, name, content_hash in zip(written["class_name"], written["name"], written["content_hash"]):
+            stored[(class_name, name)] = content_hash
+        return written["definition"]
+
+    def test_overloads_share_a_hash(self):
+        _, methods, _ = _parsing_columns(self.RESULTS)
+        hashes = methods["content_hash"]
+        self.assertEqual(hashes[0], hashes[1])
+        self.assertNotEqual(hashes[0], hashes[2])
+
+    def test_unchanged_overloads_are_skipped_on_reimport(self):
+        stored = {}
+        self.assertEqual(len(self._import(stored)), 3)
+        for _ in range(3):
+            self.assertEqual(self._import(stored), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Regression tests for the C# parser on non-ASCII source with a UTF-8 BOM
+"""
+import codecs
+import os
+import tempfile
+import unittest
+
+from src.parsers.csharp_parser import CSharpParser
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "unicode_bom.cs")
+
+
+class CSharpParserUnicodeTest(unittest.TestCase):
+    """tree-sitter reports byte offsets, so names after multi-byte characters must still come out whole"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = CSharpParser()
+        cls.result = cls.parser.parse_file(FIXTURE)
+
+    def test_fixture_starts_with_bom(self):
+        with open(FIXTURE, 'rb') as f:
+            self.assertTrue(f.read().startswith(codecs.BOM_UTF8))
+
+    def test_class_names_and_visibility(self):
+        classes = [(c["name"], c["visibility"]) for c in self.result["classes"]]
+        self.assertEqual(classes, [("Größe", "public"), ("Helfer", "internal")])
+
+    def test_methods_and_calls(self):
+        methods = {
+            (c["name"], m["name"]): (m["visibility"], m["method_calls"])
+            for c in self.result["classes"]
+            for m in c["methods"]
+        }
+        self.assertEqual(methods, {
+            ("Größe", "Berechne"): ("public", ["Prüfe", "Zähle"]),
+            ("Größe", "Zähle"): ("private", []),
+            ("Helfer", "Prüfe"): ("public", ["WriteLine"]),
+        })
+
+    def test_definition_is_decoded_text(self):
+        berechne = self.result["classes"][0]["methods"][0]
+        self.assertTrue(berechne["definition"].startswith("public void Berechne()"))
+        self.assertIn('"naïve — 東京"', berechne["definition"])
+        self.assertTrue(berechne["definition"].endswith("}"))
+
+    def test_bom_does_not_change_result(self):
+        with open(FIXTURE, 'rb') as f:
+            source = f.read()[len(codecs.BOM_UTF8):]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "no_bom.cs")
+            with open(path, 'wb') as f:
+                f.write(source)
+            result = self.parser.parse_file(path)
+        self.assertEqual(result["classes"], self.result["classes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the directory tree text rendering
+"""
+import os
+import tempfile
+import unittest
+
+from src.utils.directory_scanner import get_directory_tree, generate_text_tree
+
+NESTED_ITEMS = [
+    ('folder', 'src', 0, ''),
+    ('folder', 'api', 1, ''),
+    ('file', 'routes.cs', 2, ''),
+    ('folder', 'models', 2, ''),
+    ('file', 'User.cs', 3, ''),
+    ('file', 'Order.cs', 3, ''),
+    ('file', 'Startup.cs', 1, ''),
+    ('folder', 'docs', 0, ''),
+    ('file', 'index.md', 1, ''),
+    ('file', 'README.md', 0, ''),
+]
+
+NESTED_TEXT = """project
+📁 src
+├── 📁 api
+│   ├── 📄 routes.cs
+│   └── 📁 models
+│   │   ├── 📄 User.cs
+│   │   └── 📄 Order.cs
+└── 📄 Startup.cs
+📁 docs
+└── 📄 index.md
+📄 README.md"""
+
+
+class GenerateTextTreeTest(unittest.TestCase):
+
+    def test_nested_tree(self):
+        self.assertEqual(generate_text_tree(NESTED_ITEMS, 'project'), NESTED_TEXT)
+
+    def test_empty_tree(self):
+        self.assertEqual(generate_text_tree([], 'project'), 'project')
+
+    def test_scanned_tree_respects_gitignore(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'src', 'bin'))
+            for path in ('.gitignore', 'src/App.cs', 'src/bin/App.dll'):
+                with open(os.path.join(tmp, path), 'w') as f:
+                    f.write('bin/\n' if path == '.gitignore' else '')
+
+            text = generate_text_tree(get_directory_tree(tmp), 'project')
+
+        self.assertEqual(text, "project\n📄 .gitignore\n📁 src\n└── 📄 App.cs")
+
+
+if __name__ == "__main__":
+    unittest.main()
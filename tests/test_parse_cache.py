@@ -0,0 +1,103 @@
+"""
+Tests for the persistent parse cache: misses, hits and invalidation on change
+"""
+import os
+import tempfile
+import unittest
+
+from src.parsers.parse_cache import ParseCache
+from src.parsers.parser_manager import ParserManager
+
+SOURCE = """
+public class Greeter
+{
+    public void Hello() { Say(); }
+    private void Say() { }
+}
+"""
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        self.file_path = os.path.join(self.tmp, "Greeter.cs")
+        self._write(SOURCE)
+        self.cache = ParseCache(os.path.join(self.tmp, "cache.db"))
+
+    def tearDown(self):
+        self.cache.close()
+        self._tmp.cleanup()
+
+    def _write(self, text: str):
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_miss_then_hit(self):
+        hits, keys = self.cache.lookup("csharp", [self.file_path])
+        self.assertEqual(hits, {})
+        self.assertIn(self.file_path, keys)
+
+        result = {"file_path": self.file_path, "classes": [{"name": "Greeter", "methods": []}]}
+        self.cache.store(keys, {self.file_path: result})
+
+        hits, _ = self.cache.lookup("csharp", [self.file_path])
+        self.assertEqual(hits, {self.file_path: result})
+
+    def test_changed_file_is_a_miss(self):
+        _, keys = self.cache.lookup("csharp", [self.file_path])
+        self.cache.store(keys, {self.file_path: {"classes": []}})
+
+        self._write(SOURCE + "// edited\n")
+        hits, _ = self.cache.lookup("csharp", [self.file_path])
+        self.assertEqual(hits, {})
+
+    def test_language_is_part_of_key(self):
+        _, keys = self.cache.lookup("csharp", [self.file_path])
+        self.cache.store(keys, {self.file_path: {"classes": []}})
+
+        hits, _ = self.cache.lookup("other", [self.file_path])
+        self.assertEqual(hits, {})
+
+    def test_errors_are_not_cached(self):
+        _, keys = self.cache.lookup("csharp", [self.file_path])
+        self.cache.store(keys, {self.file_path: {"error": "boom"}})
+
+        hits, _ = self.cache.lookup("csharp", [self.file_path])
+        self.assertEqual(hits, {})
+
+    def test_unreadable_file_has_no_key(self):
+        missing = os.path.join(self.tmp, "Missing.cs")
+        hits, keys = self.cache.lookup("csharp", [missing])
+        self.assertEqual((hits, keys), ({}, {}))
+
+
+class ParserManagerCacheTest(unittest.TestCase):
+
+    def test_cached_results_match_a_fresh_parse(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, "Greeter.cs")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(SOURCE)
+            grouped = {"csharp": [file_path]}
+
+            manager = ParserManager(cache_path=os.path.join(tmp, "cache.db"))
+            try:
+                first = manager.parse_files_by_language(grouped)
+                hits, _ = manager.cache.lookup("csharp", [file_path])
+                self.assertEqual(list(hits), [file_path])
+                second = manager.parse_files_by_language(grouped)
+            finally:
+                manager.close()
+
+            uncached = ParserManager().parse_files_by_language(grouped)
+
+        self.assertEqual(first, uncached)
+        self.assertEqual(second, uncached)
+        methods = [m["name"] for m in second["csharp"][file_path]["classes"][0]["methods"]]
+        self.assertEqual(methods, ["Hello", "Say"])
+
+
+if __name__ == "__main__":
+    unittest.main()